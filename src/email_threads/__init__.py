@@ -53,17 +53,24 @@ __license__ = "MIT"
 
 # Public API exports
 from .account import EmailAccount
+from .async_sender import AsyncEmailSender
+from .connection_pool import ConnectionPool
 from .message import EmailMessage
 from .monitor import EmailThreadsMonitor
-from .sender import EmailSender
+from .persistent_storage import PersistentMessageStorage
+from .sender import EmailSender, SendSpec
 from .storage import MessageStorage
 from .reply_chain import ReplyChainBuilder
 
 __all__ = [
     "EmailAccount",
+    "AsyncEmailSender",
+    "ConnectionPool",
     "EmailMessage",
     "EmailThreadsMonitor",
     "EmailSender",
+    "SendSpec",
     "MessageStorage",
+    "PersistentMessageStorage",
     "ReplyChainBuilder",
 ]
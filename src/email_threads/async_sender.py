@@ -0,0 +1,258 @@
+"""Asynchronous email sending module using aiosmtplib."""
+
+import asyncio
+import logging
+from typing import Optional
+
+try:
+    import aiosmtplib
+except ImportError:  # Optional dependency, only needed by AsyncEmailSender
+    aiosmtplib = None
+
+from .account import EmailAccount
+from .message import EmailMessage
+from .sender import EmailSender, SendSpec
+
+logger = logging.getLogger(__name__)
+
+# Default upper bound on SMTP connections open at the same time
+ASYNC_MAX_CONNECTIONS = 15
+
+
+class AsyncEmailSender(EmailSender):
+    """
+    Email sender for asyncio applications.
+
+    Messages are built like EmailSender does, but sent with aiosmtplib,
+    so sends running concurrently on the event loop overlap their
+    network waits instead of blocking a thread each. Up to
+    max_connections logged-in connections are opened on demand and
+    reused by later sends.
+
+    Requires the optional aiosmtplib dependency
+    (pip install "email-threads[async]"). Use it as an async context
+    manager, or call close() when done:
+
+        async with AsyncEmailSender(account) as sender:
+            await sender.send_async(to, subject, text)
+    """
+
+    def __init__(
+        self,
+        account: EmailAccount,
+        max_connections: int = ASYNC_MAX_CONNECTIONS
+    ):
+        """
+        Initialize async email sender with an account.
+
+        Args:
+            account: EmailAccount with SMTP configuration
+            max_connections: Most SMTP connections used at the same time
+
+        Raises:
+            ImportError: If aiosmtplib is not installed
+            ValueError: If account doesn't have SMTP configuration
+        """
+        if aiosmtplib is None:
+            raise ImportError(
+                "AsyncEmailSender requires aiosmtplib: "
+                "pip install \"email-threads[async]\""
+            )
+
+        super().__init__(account)
+
+        self.max_connections = max_connections
+        # Open connections not currently sending
+        self._idle: list["aiosmtplib.SMTP"] = []
+        self._semaphore = asyncio.Semaphore(max_connections)
+
+    async def __aenter__(self) -> "AsyncEmailSender":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    async def send_async(
+        self,
+        to: str,
+        subject: str,
+        text: str,
+        html: Optional[str] = None,
+        reply_to_message: Optional[EmailMessage] = None,
+        cc: Optional[list[str]] = None,
+        bcc: Optional[list[str]] = None,
+    ) -> str:
+        """
+        Send an email.
+
+        Args:
+            to: Recipient email address
+            subject: Email subject
+            text: Plain text content
+            html: HTML content (optional)
+            reply_to_message: If this is a reply, the original message
+            cc: CC recipients (optional)
+            bcc: BCC recipients (optional)
+
+        Returns:
+            Generated Message-ID for the sent email
+
+        Raises:
+            aiosmtplib.SMTPException: If sending fails
+        """
+        logger.info(
+            f"Sending email from {self.account.email} to {to}: "
+            f"{subject[:50]}..."
+        )
+
+        raw, message_id = self._build_message(
+            SendSpec(to, subject, text, html, reply_to_message, cc, bcc)
+        )
+
+        try:
+            await self._deliver_async(
+                raw,
+                self._collect_recipients(to, cc, bcc)
+            )
+            logger.info(f"Email sent successfully: {message_id}")
+        except Exception as e:
+            logger.error(f"Failed to send email: {e}", exc_info=True)
+            raise
+
+        return message_id
+
+    async def send_many_async(
+        self,
+        items: list[SendSpec]
+    ) -> list[Optional[str]]:
+        """
+        Send several emails concurrently.
+
+        All messages are built first, then sent concurrently over at
+        most max_connections connections.
+
+        A failed item does not stop the batch: it is logged and its
+        result is None.
+
+        Args:
+            items: Emails to send
+
+        Returns:
+            Generated Message-ID of each item, in order, or None for
+            items that could not be sent
+        """
+        logger.info(
+            f"Sending {len(items)} email(s) from {self.account.email}"
+        )
+
+        prepared = []
+        for spec in items:
+            raw, message_id = self._build_message(spec)
+            recipients = self._collect_recipients(spec.to, spec.cc, spec.bcc)
+            prepared.append((raw, message_id, recipients))
+
+        async def send_one(raw, message_id, recipients) -> Optional[str]:
+            try:
+                await self._deliver_async(raw, recipients)
+            except Exception as e:
+                logger.error(f"Failed to send email {message_id}: {e}")
+                return None
+            logger.debug("Email sent: %s", message_id)
+            return message_id
+
+        results = await asyncio.gather(
+            *(send_one(*item) for item in prepared)
+        )
+
+        sent = sum(result is not None for result in results)
+        logger.info(f"Sent {sent}/{len(items)} email(s)")
+        return list(results)
+
+    async def close(self) -> None:
+        """Log out of every open SMTP connection."""
+        idle, self._idle = self._idle, []
+        for smtp in idle:
+            await self._discard(smtp)
+
+    async def _deliver_async(
+        self,
+        raw: bytes,
+        recipients: list[str]
+    ) -> None:
+        """
+        Send a message on an idle or newly opened connection.
+
+        If the server closed an idle connection in the meantime, the
+        send is retried once on a fresh connection.
+
+        Args:
+            raw: Message from _build_message()
+            recipients: Envelope recipients
+
+        Raises:
+            aiosmtplib.SMTPException: If sending fails
+        """
+        async with self._semaphore:
+            if self._idle:
+                smtp = self._idle.pop()
+            else:
+                smtp = await self._open_connection_async()
+
+            try:
+                try:
+                    await smtp.sendmail(self.account.email, recipients, raw)
+                except aiosmtplib.SMTPServerDisconnected:
+                    logger.debug("SMTP connection lost, reconnecting")
+                    await self._discard(smtp)
+                    smtp = await self._open_connection_async()
+                    await smtp.sendmail(self.account.email, recipients, raw)
+            except aiosmtplib.SMTPRecipientsRefused:
+                # The transaction was reset, the session stays usable
+                self._idle.append(smtp)
+                raise
+            except BaseException:
+                # The session state is unknown, do not reuse it. Closed
+                # without QUIT, which cannot be awaited once cancelled
+                smtp.close()
+                raise
+
+            self._idle.append(smtp)
+
+    async def _open_connection_async(self) -> "aiosmtplib.SMTP":
+        """
+        Connect and log in to the account's SMTP server.
+
+        Returns:
+            Authenticated aiosmtplib.SMTP connection
+        """
+        logger.debug(
+            "Connecting to SMTP server: %s:%s",
+            self.account.smtp_server, self.account.smtp_port
+        )
+
+        smtp = aiosmtplib.SMTP(
+            hostname=self.account.smtp_server,
+            port=self.account.smtp_port,
+            # Implicit TLS for port 465, STARTTLS otherwise
+            use_tls=self.account.smtp_ssl,
+            start_tls=not self.account.smtp_ssl,
+            tls_context=self._SSL_CTX
+        )
+        await smtp.connect()
+        try:
+            await smtp.login(self.account.email, self.account.password)
+        except BaseException:
+            smtp.close()
+            raise
+
+        logger.debug("SMTP authentication successful")
+        return smtp
+
+    @staticmethod
+    async def _discard(smtp: "aiosmtplib.SMTP") -> None:
+        """Close a connection, ignoring errors from a broken session."""
+        try:
+            await smtp.quit()
+        except Exception:
+            smtp.close()
+        logger.debug("SMTP connection closed")
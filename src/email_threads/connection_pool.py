@@ -0,0 +1,171 @@
+"""Shared IMAP connection pool module."""
+
+import logging
+import threading
+import time
+
+from imap_tools import MailBox
+
+from .account import EmailAccount
+
+logger = logging.getLogger(__name__)
+
+# Servers may drop connections after ~30 minutes without a command
+# (RFC 3501 section 5.4), so a NOOP is issued comfortably before that
+NOOP_INTERVAL = 25 * 60
+
+# Upper bound on simultaneous logins against the same IMAP server
+MAX_CONNECTS_PER_SERVER = 5
+
+# Connection roles: each account gets one session sitting in IDLE and
+# one for read-write operations, so operations never interrupt IDLE
+IDLE = "idle"
+READ_WRITE = "rw"
+
+
+class PooledConnection:
+    """
+    An authenticated IMAP session kept alive across reconnect cycles.
+
+    The lock serializes every command issued on the mailbox, so several
+    threads can share a READ_WRITE session without corrupting the
+    protocol state. It is reentrant, so helpers may take it again while
+    their caller holds it.
+
+    IDLE sessions are not shareable: EmailThreadsMonitor releases the
+    lock while the session sits in IDLE, and any command sent then would
+    break the IDLE exchange. Only the monitor may use them.
+    """
+
+    def __init__(self, mailbox: MailBox):
+        """
+        Wrap an authenticated mailbox.
+
+        Args:
+            mailbox: Logged in MailBox instance
+        """
+        self.mailbox = mailbox
+        self.lock = threading.RLock()
+        self.last_noop = time.monotonic()
+
+
+class ConnectionPool:
+    """
+    Cache of authenticated IMAP sessions keyed by account and role.
+
+    Each (imap_server, email) pair has two slots: IDLE, reserved for
+    EmailThreadsMonitor to wait for new mail, and READ_WRITE, for
+    operations such as flagging or appending messages. Sharing one pool
+    between components lets them reuse READ_WRITE sessions instead of
+    logging in per operation, without dropping the IDLE session to run
+    a command. Other code must never acquire IDLE sessions.
+
+    Connections are created lazily on first use and reused until they
+    are explicitly invalidated, so the TLS handshake and LOGIN are only
+    paid again after the session actually failed.
+
+    Logins are limited to MAX_CONNECTS_PER_SERVER at a time per IMAP
+    server across all pools, so many accounts recovering from the same
+    outage do not hit the server at once.
+    """
+
+    _server_semaphores: dict[str, threading.Semaphore] = {}
+    _server_semaphores_lock = threading.Lock()
+
+    def __init__(self):
+        """Initialize an empty connection pool."""
+        self._connections: dict[tuple[str, str, str], PooledConnection] = {}
+        self._lock = threading.Lock()
+
+    def acquire(
+        self,
+        account: EmailAccount,
+        role: str = IDLE
+    ) -> PooledConnection:
+        """
+        Get the cached connection for an account, logging in if needed.
+
+        Hold the connection's lock while issuing commands on it. Code
+        other than EmailThreadsMonitor must use READ_WRITE: the IDLE
+        session spends most of its time in IDLE without its lock held.
+
+        Args:
+            account: EmailAccount to connect
+            role: IDLE (monitor only) or READ_WRITE
+
+        Returns:
+            PooledConnection holding an authenticated MailBox
+        """
+        key = (account.imap_server, account.email, role)
+
+        with self._lock:
+            conn = self._connections.get(key)
+        if conn is not None:
+            return conn
+
+        logger.debug(
+            "[%s] Connecting to IMAP (%s): %s:%s",
+            account.email, role, account.imap_server, account.imap_port
+        )
+        with self._server_semaphore(account.imap_server):
+            mailbox = MailBox(account.imap_server, account.imap_port).login(
+                account.email,
+                account.password
+            )
+
+        with self._lock:
+            conn = self._connections.setdefault(key, PooledConnection(mailbox))
+        if conn.mailbox is not mailbox:
+            # Another thread logged in concurrently, keep its session
+            self._logout(mailbox)
+        return conn
+
+    def keepalive(self, conn: PooledConnection) -> None:
+        """
+        Issue a NOOP if the connection has been quiet for too long.
+
+        The caller must hold conn.lock, and the connection must not be
+        in IDLE (for IDLE sessions only the monitor can ensure that).
+
+        Args:
+            conn: Connection to keep alive
+        """
+        now = time.monotonic()
+        if now - conn.last_noop >= NOOP_INTERVAL:
+            conn.mailbox.client.noop()
+            conn.last_noop = now
+
+    def invalidate(self, account: EmailAccount, role: str = IDLE) -> None:
+        """
+        Drop the cached connection for an account.
+
+        The next acquire() will open a fresh session.
+
+        Args:
+            account: EmailAccount whose connection failed
+            role: IDLE or READ_WRITE
+        """
+        with self._lock:
+            conn = self._connections.pop(
+                (account.imap_server, account.email, role), None
+            )
+        if conn is not None:
+            self._logout(conn.mailbox)
+
+    @classmethod
+    def _server_semaphore(cls, imap_server: str) -> threading.Semaphore:
+        """Get the semaphore limiting concurrent logins to a server."""
+        with cls._server_semaphores_lock:
+            semaphore = cls._server_semaphores.get(imap_server)
+            if semaphore is None:
+                semaphore = threading.Semaphore(MAX_CONNECTS_PER_SERVER)
+                cls._server_semaphores[imap_server] = semaphore
+            return semaphore
+
+    @staticmethod
+    def _logout(mailbox: MailBox) -> None:
+        """Log out, ignoring errors from an already broken session."""
+        try:
+            mailbox.logout()
+        except Exception:
+            pass
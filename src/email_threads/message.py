@@ -1,11 +1,12 @@
 """Email message data structure module."""
 
+from collections.abc import Sequence
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class EmailMessage:
     """
     Email message data structure.
@@ -14,33 +15,37 @@ class EmailMessage:
     message, including headers, content, and metadata needed for
     building reply chains.
 
+    Instances use __slots__, since one is kept in storage for every
+    monitored message. The optional sequence fields default to a
+    shared empty tuple instead of a fresh list per instance.
+
     Attributes:
         message_id: Unique message identifier (Message-ID header)
         from_: Sender email address
-        to: List of recipient email addresses
+        to: Recipient email addresses
         subject: Email subject line
         text: Plain text content of the email
         html: HTML content of the email (optional)
         date: Email timestamp
         in_reply_to: Message-ID of the email being replied to (optional)
-        references: List of Message-IDs in the conversation thread
-        cc: List of CC recipients (optional)
-        bcc: List of BCC recipients (optional)
+        references: Message-IDs in the conversation thread
+        cc: CC recipients (optional)
+        bcc: BCC recipients (optional)
         raw_headers: Dictionary of raw email headers (optional)
     """
 
     message_id: str
     from_: str
-    to: list[str]
+    to: Sequence[str]
     subject: str
-    text: str
+    text: str = field(repr=False)
     date: datetime
-    html: Optional[str] = None
+    html: Optional[str] = field(default=None, repr=False)
     in_reply_to: Optional[str] = None
-    references: list[str] = field(default_factory=list)
-    cc: list[str] = field(default_factory=list)
-    bcc: list[str] = field(default_factory=list)
-    raw_headers: Optional[dict] = None
+    references: Sequence[str] = field(default=(), repr=False)
+    cc: Sequence[str] = ()
+    bcc: Sequence[str] = ()
+    raw_headers: Optional[dict] = field(default=None, repr=False)
 
     def __post_init__(self):
         """Validate message data after initialization."""
@@ -69,17 +74,6 @@ class EmailMessage:
         Returns:
             Combined list of all recipient email addresses
         """
-        return self.to + self.cc + self.bcc
-
-    def __repr__(self) -> str:
-        """
-        String representation for debugging.
+        # Unpacking builds a new list whatever sequence types are stored
+        return [*self.to, *self.cc, *self.bcc]
 
-        Returns:
-            Formatted string with key message information
-        """
-        return (
-            f"EmailMessage(message_id='{self.message_id[:20]}...', "
-            f"from_='{self.from_}', subject='{self.subject[:30]}...', "
-            f"date={self.date})"
-        )
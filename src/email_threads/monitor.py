@@ -1,18 +1,153 @@
 """Email threads monitoring module."""
 
+import asyncio
+import heapq
+import itertools
 import logging
+import multiprocessing
+import os
+import queue
+import random
+import re
+import selectors
+import signal
+import socket
+import sys
 import threading
-from typing import Callable, Optional
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Iterable, Optional
 
-from imap_tools import MailBox, AND
+from imap_tools import MailBox, MailMessage, MailMessageFlags, UidRange, AND
+
+try:
+    import aioimaplib
+except ImportError:  # Optional dependency, only needed by start_asyncio()
+    aioimaplib = None
 
 from .account import EmailAccount
+from .connection_pool import (
+    MAX_CONNECTS_PER_SERVER,
+    ConnectionPool,
+    PooledConnection,
+)
 from .message import EmailMessage
 from .reply_chain import ReplyChainBuilder
 from .storage import MessageStorage
 
 logger = logging.getLogger(__name__)
 
+# Reconnect backoff bounds in seconds (doubled after each failure)
+RECONNECT_BASE_DELAY = 2
+RECONNECT_MAX_DELAY = 300
+
+# Random extra backoff in seconds, so accounts that failed together
+# (e.g. during a server outage) do not reconnect in lockstep
+RECONNECT_JITTER = 5
+
+# IDLE must be re-issued at least every 29 minutes (RFC 2177)
+IDLE_REFRESH_INTERVAL = 29 * 60
+
+# TCP keepalive on IDLE sockets: probe after this many idle seconds,
+# then every TCP_KEEPALIVE_INTERVAL seconds, giving up after
+# TCP_KEEPALIVE_COUNT unanswered probes. A connection silently dropped
+# by a NAT or firewall is noticed within about two minutes instead of
+# at the next IDLE refresh, and the probes keep NAT mappings alive
+TCP_KEEPALIVE_IDLE = 60
+TCP_KEEPALIVE_INTERVAL = 15
+TCP_KEEPALIVE_COUNT = 4
+
+# Upper bound on worker threads fetching and processing messages
+MAX_WORKERS = 8
+
+# Longest time the dispatcher blocks in select() (seconds)
+SELECT_TIMEOUT = 30
+
+# How often start_multiproc() checks for stop() while waiting for
+# messages from the worker processes (seconds)
+RESULT_POLL_INTERVAL = 1
+
+# How long stop() waits for worker processes before terminating them
+# (seconds)
+PROCESS_JOIN_TIMEOUT = 5
+
+# "[UIDNEXT n]" response code sent by the server on SELECT
+_UIDNEXT_RE = re.compile(rb"\[UIDNEXT (\d+)\]")
+
+# "UID n" item in an untagged FETCH response line
+_FETCH_UID_RE = re.compile(rb"UID (\d+)")
+
+# One "<id@domain>" token of a References header
+_MSGID_RE = re.compile(r"<[^<>\s]+>")
+
+# Shared value of empty sequence fields, instead of a new list each
+_EMPTY: tuple = ()
+
+# Distinct recipient tuples remembered for interning; the cache starts
+# over when it reaches this size
+ADDRESS_CACHE_SIZE = 10_000
+
+
+def _reconnect_delay(failures: int) -> float:
+    """
+    Get the backoff before the next reconnect attempt.
+
+    Args:
+        failures: Number of consecutive failures so far
+
+    Returns:
+        Delay in seconds, exponential in failures with random jitter
+    """
+    return min(
+        RECONNECT_MAX_DELAY,
+        RECONNECT_BASE_DELAY * 2 ** failures
+        + random.uniform(0, RECONNECT_JITTER)
+    )
+
+
+def _enable_tcp_keepalive(sock: socket.socket) -> None:
+    """
+    Turn on TCP keepalive probes for a socket.
+
+    The timing options are set where the platform supports them (macOS
+    names the idle time TCP_KEEPALIVE).
+
+    Args:
+        sock: Connected socket
+    """
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+    idle_option = getattr(
+        socket, "TCP_KEEPIDLE", getattr(socket, "TCP_KEEPALIVE", None)
+    )
+    for option, value in (
+        (idle_option, TCP_KEEPALIVE_IDLE),
+        (getattr(socket, "TCP_KEEPINTVL", None), TCP_KEEPALIVE_INTERVAL),
+        (getattr(socket, "TCP_KEEPCNT", None), TCP_KEEPALIVE_COUNT),
+    ):
+        if option is not None:
+            sock.setsockopt(socket.IPPROTO_TCP, option, value)
+
+
+def _extract_msgid(msg) -> str:
+    """
+    Get the Message-ID of an imap_tools message.
+
+    The header is parsed once and cached on the message, so the
+    duplicate check and the conversion share the result.
+
+    Args:
+        msg: imap_tools Message object
+
+    Returns:
+        Message-ID, or an empty string if the header is missing
+    """
+    try:
+        return msg._cached_msgid
+    except AttributeError:
+        msg_id = msg.headers.get("message-id", ("",))[0].strip()
+        msg._cached_msgid = msg_id
+        return msg_id
+
 
 class EmailThreadsMonitor:
     """
@@ -23,7 +158,8 @@ class EmailThreadsMonitor:
     monitored accounts and builds complete reply chains.
 
     Key features:
-    - Multi-account monitoring with separate threads
+    - Multi-account monitoring from a single selector thread, with
+      fetching and callbacks run on a small worker pool
     - IMAP IDLE for real-time notifications (1-2 second latency)
     - Automatic reply chain construction
     - Thread-safe message storage
@@ -33,7 +169,10 @@ class EmailThreadsMonitor:
         self,
         accounts: list[EmailAccount],
         on_message_callback: Callable[[EmailMessage, list[EmailMessage]], None],
-        auto_mark_seen: bool = False
+        auto_mark_seen: bool = False,
+        intern_addresses: bool = True,
+        connection_pool: Optional[ConnectionPool] = None,
+        storage: Optional[MessageStorage] = None
     ):
         """
         Initialize the email threads monitor.
@@ -44,10 +183,27 @@ class EmailThreadsMonitor:
                                  relevant message is received.
                                  Parameters: (current_message, reply_chain)
             auto_mark_seen: If True, automatically mark processed emails as
-                           seen. This significantly improves performance by
-                           reducing duplicate fetches, but changes mailbox
-                           state. Recommended for dedicated agent accounts.
+                           seen. New messages are tracked by UID, so this
+                           does not affect performance; it only changes
+                           mailbox state.
                            Default: False (conservative, no mailbox changes)
+            intern_addresses: If True, intern sender and recipient
+                              addresses with sys.intern() so messages
+                              exchanged between the same people share
+                              one string per address, and messages with
+                              the same recipients one tuple. Interned
+                              strings are kept for the life of the
+                              process.
+                              Default: True
+            connection_pool: ConnectionPool to take IDLE sessions from,
+                             e.g. to share it with code that needs
+                             read-write sessions to the same accounts.
+                             That code must not touch the IDLE ones.
+                             Default: a private pool
+            storage: MessageStorage to keep messages in, e.g. a
+                     PersistentMessageStorage so that messages already
+                     processed in an earlier run are not downloaded again.
+                     Default: a new in-memory MessageStorage
 
         Raises:
             ValueError: If accounts list is empty
@@ -58,53 +214,70 @@ class EmailThreadsMonitor:
         self.accounts = accounts
         self.on_message_callback = on_message_callback
         self.auto_mark_seen = auto_mark_seen
+        self.intern_addresses = intern_addresses
+
+        # Interned copy of each recipient tuple seen, shared by every
+        # message with the same recipients (intern_addresses only)
+        self._address_tuples: dict[tuple[str, ...], tuple[str, ...]] = {}
 
         # Create monitored email addresses set for filtering
-        self.monitored_emails = {acc.email for acc in accounts}
+        self.monitored_emails = frozenset(acc.email for acc in accounts)
+
+        # Next UID to fetch per account, recorded at connection time so
+        # IDLE wakeups only fetch messages that arrived since
+        self._uid_next: dict[str, int] = {}
 
         # Initialize storage and reply chain builder
-        self.storage = MessageStorage()
+        self.storage = storage if storage is not None else MessageStorage()
         self.chain_builder = ReplyChainBuilder(self.storage)
 
-        # Threading control
+        # Authenticated IMAP sessions shared across reconnect cycles
+        self._pool = connection_pool or ConnectionPool()
+
+        # Threading control: one dispatcher thread waits on the IDLE
+        # sockets of all accounts and hands work to the executor
         self._stop_event = threading.Event()
-        self._monitor_threads: list[threading.Thread] = []
+        self._selector: Optional[selectors.BaseSelector] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._dispatcher: Optional[threading.Thread] = None
+
+        # Worker -> dispatcher hand-off: (account, connection in IDLE)
+        # to watch, or (account, None) to reconnect after a failure
+        self._dispatch_queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._wakeup_reader: Optional[socket.socket] = None
+        self._wakeup_writer: Optional[socket.socket] = None
+
+        # Worker processes and their shared stop event
+        # (start_multiproc only)
+        self._processes: list[multiprocessing.Process] = []
+        self._process_stop_event = None
+
+        # asyncio control (start_asyncio only)
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._async_stop_event: Optional[asyncio.Event] = None
+        self._async_server_semaphores: dict[str, asyncio.Semaphore] = {}
 
         logger.info(
             f"EmailThreadsMonitor initialized with "
             f"{len(accounts)} account(s)"
         )
-        logger.debug(f"Monitored emails: {self.monitored_emails}")
+        logger.debug("Monitored emails: %s", self.monitored_emails)
 
     def start(self) -> None:
         """
         Start monitoring all accounts (blocking).
 
-        This method starts a monitoring thread for each account and
-        then blocks until stop() is called. Each thread uses IMAP IDLE
-        to receive real-time notifications of new emails.
+        This method starts the dispatcher thread and then blocks until
+        stop() is called. The dispatcher waits on the IMAP IDLE sockets
+        of all accounts at once and hands new-mail notifications to a
+        pool of at most MAX_WORKERS threads.
 
         Note: This is a blocking call. Use start_async() for
         non-blocking operation.
         """
         logger.info("Starting email monitoring (blocking mode)...")
 
-        # Clear stop event
-        self._stop_event.clear()
-
-        # Start monitoring threads for each account
-        for account in self.accounts:
-            thread = threading.Thread(
-                target=self._monitor_account,
-                args=(account,),
-                daemon=True,
-                name=f"Monitor-{account.email}"
-            )
-            thread.start()
-            self._monitor_threads.append(thread)
-            logger.info(f"Monitoring thread started for {account.email}")
-
-        logger.info("All monitoring threads started")
+        self._start_dispatcher()
 
         # Block until stop is called
         try:
@@ -119,46 +292,175 @@ class EmailThreadsMonitor:
         """
         Start monitoring all accounts (non-blocking).
 
-        This method starts monitoring threads and returns immediately.
+        This method starts the dispatcher thread and returns immediately.
         Call stop() to stop monitoring.
         """
         logger.info("Starting email monitoring (async mode)...")
 
-        # Clear stop event
-        self._stop_event.clear()
+        self._start_dispatcher()
 
-        # Start monitoring threads for each account
-        for account in self.accounts:
-            thread = threading.Thread(
-                target=self._monitor_account,
-                args=(account,),
-                daemon=True,
+    async def start_asyncio(self) -> None:
+        """
+        Start monitoring all accounts on the running event loop.
+
+        Unlike start() and start_async(), no thread is created per
+        account: each account is monitored by an asyncio task driving
+        IMAP IDLE through aioimaplib, so a single thread can watch
+        hundreds of mailboxes. The coroutine returns once stop() is
+        called.
+
+        Requires the optional aioimaplib dependency
+        (pip install "email-threads[async]").
+
+        Raises:
+            ImportError: If aioimaplib is not installed
+        """
+        if aioimaplib is None:
+            raise ImportError(
+                "start_asyncio() requires aioimaplib: "
+                "pip install \"email-threads[async]\""
+            )
+
+        logger.info("Starting email monitoring (asyncio mode)...")
+
+        self._loop = asyncio.get_running_loop()
+        self._async_stop_event = asyncio.Event()
+        self._async_server_semaphores = {}
+
+        tasks = [
+            asyncio.create_task(
+                self._monitor_account_async(account),
                 name=f"Monitor-{account.email}"
             )
-            thread.start()
-            self._monitor_threads.append(thread)
-            logger.info(
-                f"Monitoring thread started for {account.email} (async)"
+            for account in self.accounts
+        ]
+        logger.info(f"All monitoring tasks started ({len(tasks)} account(s))")
+
+        try:
+            await self._async_stop_event.wait()
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            self._loop = None
+            self._async_stop_event = None
+
+        logger.info("Monitoring stopped")
+
+    def start_multiproc(self, num_procs: Optional[int] = None) -> None:
+        """
+        Start monitoring with accounts partitioned across processes
+        (blocking).
+
+        Accounts are split into num_procs shards by hash of their email
+        address, and each shard is monitored by its own worker process
+        running a separate EmailThreadsMonitor. Message conversion and
+        reply chain building thus run in parallel instead of contending
+        for the GIL, which matters with many busy accounts.
+
+        Each worker keeps its own storage, so a reply chain only spans
+        messages received by accounts of the same shard; missing parents
+        are tolerated as usual. Chains are sent back to this process,
+        stored in self.storage, and passed to the callback here, one at
+        a time. This method blocks until stop() is called.
+
+        Args:
+            num_procs: Number of worker processes.
+                       Default: os.cpu_count(), at most one per account
+        """
+        num_procs = min(num_procs or os.cpu_count() or 1, len(self.accounts))
+
+        shards: list[list[EmailAccount]] = [[] for _ in range(num_procs)]
+        for account in self.accounts:
+            shards[hash(account.email) % num_procs].append(account)
+
+        logger.info(
+            f"Starting email monitoring ({num_procs} process(es))..."
+        )
+
+        self._stop_event.clear()
+        results = multiprocessing.Queue()
+        self._process_stop_event = multiprocessing.Event()
+        self._processes = [
+            multiprocessing.Process(
+                target=_run_partition,
+                args=(
+                    shard,
+                    self.auto_mark_seen,
+                    self.intern_addresses,
+                    results,
+                    self._process_stop_event
+                ),
+                daemon=True,
+                name=f"Monitor-partition-{i}"
             )
+            for i, shard in enumerate(shards)
+            if shard
+        ]
+        for process in self._processes:
+            process.start()
 
-        logger.info("All monitoring threads started (async)")
+        try:
+            while not self._stop_event.is_set():
+                try:
+                    email_msg, reply_chain = results.get(
+                        timeout=RESULT_POLL_INTERVAL
+                    )
+                except queue.Empty:
+                    continue
+
+                for chain_msg in reply_chain:
+                    if not self.storage.exists(chain_msg.message_id):
+                        self.storage.add(chain_msg)
+
+                self._invoke_callback(
+                    email_msg,
+                    reply_chain,
+                    email_msg.from_
+                )
+        except KeyboardInterrupt:
+            logger.info("Keyboard interrupt received, stopping...")
+            self.stop()
+        finally:
+            results.cancel_join_thread()
+
+        logger.info("Monitoring stopped")
 
     def stop(self) -> None:
         """
         Stop monitoring all accounts.
 
-        This sets the stop event and waits for all monitoring threads
-        to terminate gracefully.
+        This sets the stop event and waits for the dispatcher thread
+        to terminate gracefully. If start_asyncio() is running, its
+        tasks are cancelled as well, and worker processes started by
+        start_multiproc() are stopped.
         """
         logger.info("Stopping email monitoring...")
         self._stop_event.set()
 
-        # Wait for all threads to finish
-        for thread in self._monitor_threads:
-            thread.join(timeout=5)
-            logger.debug(f"Thread {thread.name} stopped")
+        if self._loop is not None and self._async_stop_event is not None:
+            self._loop.call_soon_threadsafe(self._async_stop_event.set)
+
+        if self._processes:
+            self._process_stop_event.set()
+            for process in self._processes:
+                process.join(timeout=PROCESS_JOIN_TIMEOUT)
+                if process.is_alive():
+                    logger.warning(
+                        f"Process {process.name} did not stop in time, "
+                        f"terminating"
+                    )
+                    process.terminate()
+                    process.join()
+            self._processes = []
+
+        # Wait for the dispatcher to finish
+        if self._dispatcher is not None:
+            self._wakeup()
+            self._dispatcher.join(timeout=5)
+            logger.debug("Thread %s stopped", self._dispatcher.name)
+            self._dispatcher = None
 
-        self._monitor_threads.clear()
         logger.info("All monitoring threads stopped")
 
     def get_storage(self) -> MessageStorage:
@@ -186,75 +488,278 @@ class EmailThreadsMonitor:
             return self.chain_builder.build_chain(message)
         return []
 
-    def _monitor_account(self, account: EmailAccount) -> None:
+    def _start_dispatcher(self) -> None:
+        """Create the selector and worker pool and start the dispatcher."""
+        self._stop_event.clear()
+
+        workers = min(MAX_WORKERS, len(self.accounts))
+        self._selector = selectors.DefaultSelector()
+        self._executor = ThreadPoolExecutor(
+            max_workers=workers,
+            thread_name_prefix="Monitor-worker"
+        )
+
+        # Lets workers and stop() interrupt a blocking select()
+        self._wakeup_reader, self._wakeup_writer = socket.socketpair()
+        self._wakeup_reader.setblocking(False)
+        self._wakeup_writer.setblocking(False)
+        self._selector.register(
+            self._wakeup_reader,
+            selectors.EVENT_READ,
+            data=None
+        )
+
+        self._dispatcher = threading.Thread(
+            target=self._dispatch_loop,
+            daemon=True,
+            name="Monitor-dispatcher"
+        )
+        self._dispatcher.start()
+
+        logger.info(
+            f"Dispatcher started for {len(self.accounts)} account(s) "
+            f"with {workers} worker(s)"
+        )
+
+    def _dispatch_loop(self) -> None:
         """
-        Monitor a single account using IMAP IDLE.
+        Wait on the IDLE sockets of all accounts and dispatch work.
 
-        This method runs in a separate thread and continuously monitors
-        the account's inbox for new messages.
+        Only this thread touches the selector. Connecting, processing
+        new messages and refreshing IDLE run on the executor; workers
+        report back through the dispatch queue.
+        """
+        # Reconnects waiting for their backoff: (due, seq, account)
+        pending: list[tuple[float, int, EmailAccount]] = []
+        seq = itertools.count()
+        failures: dict[str, int] = {}
+        idle_since: dict[str, float] = {}
+        watched: dict[str, selectors.SelectorKey] = {}
+
+        for account in self.accounts:
+            logger.info(f"[{account.email}] Starting account monitoring")
+            self._executor.submit(self._connect_account, account)
+
+        try:
+            while not self._stop_event.is_set():
+                now = time.monotonic()
+
+                # Reconnect accounts whose backoff has elapsed
+                while pending and pending[0][0] <= now:
+                    _, _, account = heapq.heappop(pending)
+                    self._executor.submit(self._connect_account, account)
+
+                # Re-issue IDLE before the server gives up on it
+                for email, key in list(watched.items()):
+                    if now - idle_since[email] >= IDLE_REFRESH_INTERVAL:
+                        self._selector.unregister(key.fileobj)
+                        del watched[email]
+                        self._executor.submit(
+                            self._handle_idle_event, *key.data
+                        )
+
+                timeout = SELECT_TIMEOUT
+                if pending:
+                    timeout = min(timeout, max(0, pending[0][0] - now))
+
+                for key, _ in self._selector.select(timeout):
+                    if key.data is None:
+                        self._drain_wakeup()
+                        continue
+
+                    account, conn = key.data
+                    self._selector.unregister(key.fileobj)
+                    del watched[account.email]
+                    self._executor.submit(
+                        self._handle_idle_event, account, conn
+                    )
+
+                # Handle reports from the workers
+                while True:
+                    try:
+                        account, conn = self._dispatch_queue.get_nowait()
+                    except queue.Empty:
+                        break
+
+                    if self._stop_event.is_set():
+                        self._dispatch_queue.put((account, conn))
+                        break
+
+                    if conn is None:
+                        count = failures.get(account.email, 0)
+                        delay = _reconnect_delay(count)
+                        failures[account.email] = count + 1
+                        logger.info(
+                            f"[{account.email}] Waiting {delay:.1f}s "
+                            f"before reconnect..."
+                        )
+                        heapq.heappush(
+                            pending,
+                            (time.monotonic() + delay, next(seq), account)
+                        )
+                        continue
+
+                    try:
+                        watched[account.email] = self._selector.register(
+                            conn.mailbox.client.sock,
+                            selectors.EVENT_READ,
+                            data=(account, conn)
+                        )
+                    except (ValueError, OSError) as e:
+                        # The socket was closed under us
+                        logger.error(
+                            f"[{account.email}] Cannot watch connection: "
+                            f"{e}"
+                        )
+                        self._pool.invalidate(account)
+                        self._dispatch_queue.put((account, None))
+                        continue
+
+                    # The account made it into IDLE, reset its backoff
+                    failures.pop(account.email, None)
+                    idle_since[account.email] = time.monotonic()
+
+        except Exception as e:
+            logger.error(f"Dispatcher error: {e}", exc_info=True)
+            # Nothing is monitored anymore, release start()
+            self._stop_event.set()
+
+        finally:
+            self._shutdown_dispatcher(watched)
+
+    def _shutdown_dispatcher(
+        self,
+        watched: dict[str, selectors.SelectorKey]
+    ) -> None:
+        """
+        Stop the workers and close every connection.
 
         Args:
-            account: EmailAccount to monitor
+            watched: Selector keys of connections currently in IDLE
         """
-        logger.info(f"[{account.email}] Starting account monitoring")
+        self._executor.shutdown(wait=True, cancel_futures=True)
 
-        while not self._stop_event.is_set():
+        # Connections still in IDLE, including ones reported by workers
+        # that finished after the loop exited
+        idle_conns = [key.data for key in watched.values()]
+        while True:
             try:
-                # Connect to IMAP server
-                logger.debug(
-                    f"[{account.email}] Connecting to IMAP: "
-                    f"{account.imap_server}:{account.imap_port}"
-                )
-
-                with MailBox(account.imap_server).login(
-                    account.email,
-                    account.password
-                ) as mailbox:
-                    logger.info(
-                        f"[{account.email}] IMAP connection established"
-                    )
+                account, conn = self._dispatch_queue.get_nowait()
+            except queue.Empty:
+                break
+            if conn is not None:
+                idle_conns.append((account, conn))
 
-                    # Initialize: silently load existing messages to storage
-                    # (without triggering callbacks)
-                    self._initialize_existing_messages(mailbox, account)
+        for _, conn in idle_conns:
+            try:
+                conn.mailbox.idle.stop()
+            except Exception:
+                pass
 
-                    # Start IDLE loop
-                    self._idle_loop(mailbox, account)
+        for account in self.accounts:
+            self._pool.invalidate(account)
+            logger.info(f"[{account.email}] Account monitoring stopped")
 
-            except Exception as e:
-                logger.error(
-                    f"[{account.email}] Monitoring error: {e}",
-                    exc_info=True
-                )
+        self._selector.close()
+        self._wakeup_reader.close()
+        self._wakeup_writer.close()
 
-                # Check if we should stop
-                if self._stop_event.is_set():
-                    break
+    def _wakeup(self) -> None:
+        """Interrupt the dispatcher's select() call."""
+        try:
+            self._wakeup_writer.send(b"\0")
+        except (AttributeError, OSError):
+            # Not started or already closed; a full buffer means a
+            # wakeup is pending anyway
+            pass
+
+    def _drain_wakeup(self) -> None:
+        """Consume pending wakeup bytes."""
+        try:
+            while self._wakeup_reader.recv(4096):
+                pass
+        except BlockingIOError:
+            pass
 
-                # Wait before reconnecting
-                logger.info(
-                    f"[{account.email}] Waiting 10s before reconnect..."
-                )
-                self._stop_event.wait(10)
+    def _report(
+        self,
+        account: EmailAccount,
+        conn: Optional[PooledConnection]
+    ) -> None:
+        """
+        Hand an account back to the dispatcher.
 
-        logger.info(f"[{account.email}] Account monitoring stopped")
+        Args:
+            account: EmailAccount the report is about
+            conn: Connection now in IDLE to watch, or None if the
+                  account needs to reconnect
+        """
+        self._dispatch_queue.put((account, conn))
+        self._wakeup()
 
-    def _idle_loop(self, mailbox: MailBox, account: EmailAccount) -> None:
+    def _connect_account(self, account: EmailAccount) -> None:
         """
-        IMAP IDLE monitoring loop.
+        Connect an account, pre-load its messages and enter IDLE.
+
+        Runs on the executor. The IMAP session comes from the connection
+        pool; when it fails, only this account's entry is dropped and
+        the dispatcher schedules a reconnect with exponential backoff.
 
         Args:
-            mailbox: Connected MailBox instance
-            account: EmailAccount being monitored
+            account: EmailAccount to connect
         """
-        logger.debug(f"[{account.email}] Entering IDLE loop")
+        try:
+            conn = self._pool.acquire(account)
+            logger.info(f"[{account.email}] IMAP connection established")
 
-        while not self._stop_event.is_set():
             try:
-                # Start IDLE and wait for new messages
-                logger.debug(f"[{account.email}] Starting IDLE (30s)...")
+                _enable_tcp_keepalive(conn.mailbox.client.sock)
+            except OSError as e:
+                logger.warning(
+                    f"[{account.email}] Cannot enable TCP keepalive: {e}"
+                )
+
+            with conn.lock:
+                # Initialize: silently load existing messages to storage
+                # (without triggering callbacks)
+                self._initialize_existing_messages(conn.mailbox, account)
+
+                logger.debug("[%s] Starting IDLE...", account.email)
+                conn.mailbox.idle.start()
+
+            self._report(account, conn)
+
+        except Exception as e:
+            logger.error(
+                f"[{account.email}] Monitoring error: {e}",
+                exc_info=True
+            )
+            self._pool.invalidate(account)
+            self._report(account, None)
+
+    def _handle_idle_event(
+        self,
+        account: EmailAccount,
+        conn: PooledConnection
+    ) -> None:
+        """
+        Handle an IDLE notification or refresh, then re-enter IDLE.
 
-                responses = mailbox.idle.wait(timeout=30)
+        Runs on the executor after the dispatcher saw the socket become
+        readable, or when IDLE is due for a refresh. New messages are
+        stored before IDLE is re-entered, but callbacks only run once
+        the connection is back in the dispatcher's hands, so a slow
+        callback never delays watching the account.
+
+        Args:
+            account: EmailAccount being monitored
+            conn: Pooled connection currently in IDLE
+        """
+        new_messages = []
+        try:
+            with conn.lock:
+                responses = conn.mailbox.idle.poll(timeout=0)
+                conn.mailbox.idle.stop()
 
                 if responses:
                     logger.info(
@@ -262,19 +767,38 @@ class EmailThreadsMonitor:
                         f"{len(responses)} event(s)"
                     )
 
-                    # Fetch and process new messages
-                    self._process_new_messages(mailbox, account)
-                else:
-                    logger.debug(
-                        f"[{account.email}] IDLE timeout, restarting..."
+                    # Fetch and store new messages
+                    new_messages = self._process_new_messages(
+                        conn.mailbox, account
                     )
+                else:
+                    logger.debug("[%s] Refreshing IDLE...", account.email)
 
-            except Exception as e:
-                logger.error(
-                    f"[{account.email}] IDLE loop error: {e}",
-                    exc_info=True
-                )
-                break
+                self._pool.keepalive(conn)
+                conn.mailbox.idle.start()
+
+            self._report(account, conn)
+
+        except Exception as e:
+            logger.error(
+                f"[{account.email}] IDLE error: {e}",
+                exc_info=True
+            )
+            # The session state is unknown, open a fresh one next time
+            self._pool.invalidate(account)
+            self._report(account, None)
+
+        # Messages stored before a failure are still new to the callback
+        processed_count = 0
+        for email_msg in new_messages:
+            if self._dispatch_callback(email_msg, account):
+                processed_count += 1
+
+        if new_messages:
+            logger.info(
+                f"[{account.email}] Processed {processed_count} "
+                f"new message(s)"
+            )
 
     def _initialize_existing_messages(
         self,
@@ -298,33 +822,42 @@ class EmailThreadsMonitor:
         )
 
         try:
-            loaded_count = 0
             relevant_count = 0
 
-            # Fetch all existing unseen messages
-            for msg in mailbox.fetch(AND(seen=False), mark_seen=False):
-                # Get message ID
-                msg_id = msg.headers.get("message-id", [""])[0].strip()
-
-                # Skip if already in storage (shouldn't happen on first run)
-                if self.storage.exists(msg_id):
-                    continue
-
-                # Check if this message is relevant
-                if self._is_relevant_message(msg, account):
-                    # Convert to EmailMessage
-                    email_msg = self._convert_to_email_message(msg)
-
-                    # Store message WITHOUT triggering callback
-                    self.storage.add(email_msg)
-                    relevant_count += 1
+            # Messages from UIDNEXT on will be handled by IDLE wakeups
+            self._uid_next.pop(account.email, None)
+            self._uid_next[account.email] = mailbox.folder.status(
+                options=["UIDNEXT"]
+            )["UIDNEXT"]
+
+            # Fetch existing unseen messages not in storage yet
+            # (already stored ones only happen after a reconnect)
+            headers = self._fetch_headers(mailbox, AND(seen=False))
+            loaded_count = len(headers)
+            messages = self._fetch_bodies(
+                mailbox,
+                headers,
+                account,
+                mark_seen=False
+            )
 
-                    logger.debug(
-                        f"[{account.email}] Pre-loaded: "
-                        f"{email_msg.subject[:40]}..."
+            for msg in messages:
+                # Store message WITHOUT triggering callback
+                try:
+                    email_msg = self._store_message(msg)
+                except Exception as e:
+                    logger.error(
+                        f"[{account.email}] Cannot process message "
+                        f"UID {msg.uid}: {e}",
+                        exc_info=True
                     )
+                    continue
+                relevant_count += 1
 
-                loaded_count += 1
+                logger.debug(
+                    "[%s] Pre-loaded: %.40s...",
+                    account.email, email_msg.subject
+                )
 
             logger.info(
                 f"[{account.email}] Initialization complete: "
@@ -342,79 +875,78 @@ class EmailThreadsMonitor:
         self,
         mailbox: MailBox,
         account: EmailAccount
-    ) -> None:
+    ) -> list[EmailMessage]:
         """
-        Process new messages in the inbox.
+        Fetch and store new messages in the inbox.
+
+        Callbacks are left to the caller, which triggers them once it
+        released the connection.
 
         Args:
             mailbox: Connected MailBox instance
             account: EmailAccount being processed
-        """
-        logger.debug(f"[{account.email}] Fetching new messages...")
 
+        Returns:
+            Newly stored EmailMessage objects, in fetch order
+        """
+        logger.debug("[%s] Fetching new messages...", account.email)
+
+        new_messages = []
+        headers = []
+        # UIDs whose body was downloaded, stored or not
+        handled_uids = set()
+        completed = False
+        uid_next = self._uid_next.get(account.email)
         try:
-            fetched_count = 0
-            processed_count = 0
 
-            # Fetch unseen messages
-            # Use auto_mark_seen setting to reduce duplicate fetches
-            for msg in mailbox.fetch(
-                AND(seen=False),
+            # Fetch messages that arrived since the last fetch
+            if uid_next is None:
+                # Initialization failed, fall back to unseen messages
+                headers = self._fetch_headers(mailbox, AND(seen=False))
+            else:
+                # "n:*" always matches the highest UID, even below n
+                headers = [
+                    msg for msg in self._fetch_headers(
+                        mailbox,
+                        AND(uid=UidRange(uid_next, "*"))
+                    )
+                    if int(msg.uid) >= uid_next
+                ]
+
+            fetched_count = len(headers)
+            messages = self._fetch_bodies(
+                mailbox,
+                headers,
+                account,
                 mark_seen=self.auto_mark_seen
-            ):
-                fetched_count += 1
+            )
+
+            for msg in messages:
+                handled_uids.add(msg.uid)
                 logger.debug(
-                    f"[{account.email}] Processing message: "
-                    f"{msg.subject[:50]}..."
+                    "[%s] Processing message: %.50s...",
+                    account.email, msg.subject
                 )
 
-                # Get message ID early for duplicate check
-                msg_id = msg.headers.get("message-id", [""])[0].strip()
-
-                # Skip if already processed
-                if self.storage.exists(msg_id):
-                    logger.debug(
-                        f"[{account.email}] Message already processed, "
-                        f"skipping: {msg_id[:30]}..."
+                # Store message, the callback is triggered by the caller.
+                # A malformed message is skipped, not retried forever
+                try:
+                    new_messages.append(self._store_message(msg))
+                except Exception as e:
+                    logger.error(
+                        f"[{account.email}] Cannot process message "
+                        f"UID {msg.uid}: {e}",
+                        exc_info=True
                     )
-                    continue
-
-                # Check if this message is relevant
-                if self._is_relevant_message(msg, account):
-                    # Convert to EmailMessage
-                    email_msg = self._convert_to_email_message(msg)
-
-                    # Store message
-                    self.storage.add(email_msg)
 
-                    # Build reply chain
-                    reply_chain = self.chain_builder.build_chain(email_msg)
-
-                    # Trigger callback
-                    logger.info(
-                        f"[{account.email}] Triggering callback for: "
-                        f"{email_msg.subject[:50]}..."
-                    )
-
-                    try:
-                        self.on_message_callback(email_msg, reply_chain)
-                        processed_count += 1
-                    except Exception as e:
-                        logger.error(
-                            f"[{account.email}] Callback error: {e}",
-                            exc_info=True
-                        )
-                else:
-                    logger.debug(
-                        f"[{account.email}] Message not relevant, skipping"
-                    )
+            completed = True
 
             # Log summary
             if fetched_count > 0:
                 logger.info(
                     f"[{account.email}] Fetch complete: "
-                    f"fetched {fetched_count} unseen message(s), "
-                    f"processed {processed_count} new message(s)"
+                    f"fetched {fetched_count} new message(s), "
+                    f"stored {len(new_messages)} relevant message(s)"
                 )
 
         except Exception as e:
@@ -423,6 +955,476 @@ class EmailThreadsMonitor:
                 exc_info=True
             )
 
+        if uid_next is not None and headers:
+            self._advance_uid_next(account, headers, handled_uids, completed)
+
+        return new_messages
+
+    def _advance_uid_next(
+        self,
+        account: EmailAccount,
+        headers: list[MailMessage],
+        handled_uids: set[str],
+        completed: bool
+    ) -> None:
+        """
+        Move an account's UID cursor past the messages handled by a fetch.
+
+        After a failed fetch the cursor stops at the first message whose
+        body was not downloaded, so the next wakeup fetches it again.
+        Messages handled past that point are recognized as already
+        stored and skipped.
+
+        Args:
+            account: EmailAccount being processed
+            headers: Header-only messages of the fetch
+            handled_uids: UIDs whose body was downloaded
+            completed: True if the whole fetch succeeded
+        """
+        remaining = () if completed else [
+            int(msg.uid) for msg in headers if msg.uid not in handled_uids
+        ]
+        if remaining:
+            self._uid_next[account.email] = min(remaining)
+        else:
+            self._uid_next[account.email] = max(
+                int(msg.uid) for msg in headers
+            ) + 1
+
+    @staticmethod
+    def _fetch_headers(mailbox: MailBox, criteria) -> list[MailMessage]:
+        """
+        Fetch the headers of all matching messages in one bulk request.
+
+        Args:
+            mailbox: Connected MailBox instance
+            criteria: imap_tools search criteria
+
+        Returns:
+            Header-only MailMessage objects
+        """
+        return list(mailbox.fetch(
+            criteria,
+            mark_seen=False,
+            headers_only=True,
+            bulk=True
+        ))
+
+    def _fetch_bodies(
+        self,
+        mailbox: MailBox,
+        headers: list[MailMessage],
+        account: EmailAccount,
+        mark_seen: bool
+    ) -> Iterable[MailMessage]:
+        """
+        Download full messages for the header-only ones worth processing.
+
+        Relevance and duplicates are decided on headers alone, so bodies
+        and attachments of irrelevant or known mail are never fetched.
+
+        Args:
+            mailbox: Connected MailBox instance
+            headers: Header-only messages from _fetch_headers()
+            account: EmailAccount being processed
+            mark_seen: If True, mark all given messages as seen,
+                       including the skipped ones
+
+        Returns:
+            Full messages to store
+        """
+        if not headers:
+            return ()
+
+        wanted_uids, skipped_uids = self._select_messages(
+            [(msg.uid, msg) for msg in headers],
+            account
+        )
+
+        if skipped_uids and mark_seen:
+            mailbox.flag(skipped_uids, MailMessageFlags.SEEN, True)
+
+        if not wanted_uids:
+            return ()
+
+        return mailbox.fetch(
+            AND(uid=wanted_uids),
+            mark_seen=mark_seen,
+            bulk=True
+        )
+
+    def _select_messages(
+        self,
+        headers: list[tuple[str, MailMessage]],
+        account: EmailAccount
+    ) -> tuple[list[str], list[str]]:
+        """
+        Split header-only messages into ones to download and ones to skip.
+
+        A message is downloaded only if it is relevant and its Message-ID
+        is not in storage yet. Known Message-IDs are checked in a single
+        batch, and only for the relevant messages.
+
+        Args:
+            headers: (UID, header-only message) pairs
+            account: EmailAccount being processed
+
+        Returns:
+            Tuple of (UIDs to download, UIDs skipped)
+        """
+        relevant = []
+        skipped_uids = []
+        for uid, msg in headers:
+            if self._is_relevant_message(msg, account):
+                relevant.append((uid, _extract_msgid(msg)))
+            else:
+                skipped_uids.append(uid)
+
+        # Known IDs double as the set of IDs seen earlier in this batch
+        known = self.storage.exists_many(msg_id for _, msg_id in relevant)
+
+        wanted_uids = []
+        for uid, msg_id in relevant:
+            if msg_id in known:
+                skipped_uids.append(uid)
+                continue
+            if msg_id:
+                known.add(msg_id)
+            wanted_uids.append(uid)
+
+        logger.debug(
+            "[%s] %d message(s) to download, %d irrelevant or already "
+            "processed",
+            account.email, len(wanted_uids), len(skipped_uids)
+        )
+
+        return wanted_uids, skipped_uids
+
+    def _store_message(self, msg) -> EmailMessage:
+        """
+        Convert a relevant message and store it.
+
+        Args:
+            msg: imap_tools Message object
+
+        Returns:
+            The stored EmailMessage
+        """
+        email_msg = self._convert_to_email_message(msg)
+        self.storage.add(email_msg)
+        return email_msg
+
+    def _dispatch_callback(
+        self,
+        email_msg: EmailMessage,
+        account: EmailAccount
+    ) -> bool:
+        """
+        Build the reply chain for a stored message and trigger the callback.
+
+        Args:
+            email_msg: Newly stored EmailMessage
+            account: Account that received this message
+
+        Returns:
+            True if the callback completed, False if it raised
+        """
+        # Build reply chain
+        reply_chain = self.chain_builder.build_chain(email_msg)
+
+        return self._invoke_callback(email_msg, reply_chain, account.email)
+
+    def _invoke_callback(
+        self,
+        email_msg: EmailMessage,
+        reply_chain: list[EmailMessage],
+        source: str
+    ) -> bool:
+        """
+        Trigger the callback, logging instead of raising its errors.
+
+        Args:
+            email_msg: Newly stored EmailMessage
+            reply_chain: Reply chain ending with email_msg
+            source: Address used as log prefix
+
+        Returns:
+            True if the callback completed, False if it raised
+        """
+        logger.info(
+            f"[{source}] Triggering callback for: "
+            f"{email_msg.subject[:50]}..."
+        )
+
+        try:
+            self.on_message_callback(email_msg, reply_chain)
+            return True
+        except Exception as e:
+            logger.error(
+                f"[{source}] Callback error: {e}",
+                exc_info=True
+            )
+            return False
+
+    async def _monitor_account_async(self, account: EmailAccount) -> None:
+        """
+        Monitor a single account using IMAP IDLE on the event loop.
+
+        This is the asyncio counterpart of _connect_account() and
+        _handle_idle_event(), used by start_asyncio(). Cancellation
+        stops the task.
+
+        Args:
+            account: EmailAccount to monitor
+        """
+        logger.info(f"[{account.email}] Starting account monitoring (asyncio)")
+
+        failures = 0
+
+        while not self._async_stop_event.is_set():
+            imap = None
+            try:
+                logger.debug(
+                    "[%s] Connecting to IMAP: %s:%s",
+                    account.email, account.imap_server, account.imap_port
+                )
+                semaphore = self._async_server_semaphores.setdefault(
+                    account.imap_server,
+                    asyncio.Semaphore(MAX_CONNECTS_PER_SERVER)
+                )
+                async with semaphore:
+                    imap = aioimaplib.IMAP4_SSL(
+                        host=account.imap_server,
+                        port=account.imap_port
+                    )
+                    await imap.wait_hello_from_server()
+                    self._check_response(
+                        await imap.login(account.email, account.password),
+                        "LOGIN"
+                    )
+                    response = await imap.select("INBOX")
+                    self._check_response(response, "SELECT")
+                logger.info(
+                    f"[{account.email}] IMAP connection established"
+                )
+
+                # Messages from UIDNEXT on will be handled by IDLE wakeups
+                for line in response.lines:
+                    match = _UIDNEXT_RE.search(line)
+                    if match:
+                        self._uid_next[account.email] = int(match.group(1))
+                        break
+                else:
+                    self._uid_next.pop(account.email, None)
+
+                # Silently load existing messages, then wait for new ones
+                await self._fetch_async(imap, account, notify=False)
+
+                # The account made it into IDLE, reset its backoff
+                failures = 0
+                await self._idle_loop_async(imap, account)
+
+            except asyncio.CancelledError:
+                raise
+
+            except Exception as e:
+                logger.error(
+                    f"[{account.email}] Monitoring error: {e}",
+                    exc_info=True
+                )
+
+                if self._async_stop_event.is_set():
+                    break
+
+                delay = _reconnect_delay(failures)
+                failures += 1
+                logger.info(
+                    f"[{account.email}] Waiting {delay:.1f}s "
+                    f"before reconnect..."
+                )
+                await asyncio.sleep(delay)
+
+            finally:
+                if imap is not None:
+                    try:
+                        await imap.logout()
+                    except Exception:
+                        pass
+
+        logger.info(f"[{account.email}] Account monitoring stopped")
+
+    async def _idle_loop_async(self, imap, account: EmailAccount) -> None:
+        """
+        IMAP IDLE monitoring loop on the event loop.
+
+        Args:
+            imap: Authenticated aioimaplib.IMAP4_SSL client
+            account: EmailAccount being monitored
+        """
+        logger.debug("[%s] Entering IDLE loop", account.email)
+
+        while not self._async_stop_event.is_set():
+            logger.debug("[%s] Starting IDLE (30s)...", account.email)
+
+            idle = await imap.idle_start(timeout=30)
+            try:
+                push = await imap.wait_server_push(timeout=30)
+            except asyncio.TimeoutError:
+                push = None
+
+            if imap.has_pending_idle():
+                imap.idle_done()
+            await asyncio.wait_for(idle, timeout=30)
+
+            if push and push != aioimaplib.STOP_WAIT_SERVER_PUSH:
+                logger.info(
+                    f"[{account.email}] IDLE notification received: "
+                    f"{len(push)} event(s)"
+                )
+                await self._fetch_async(imap, account, notify=True)
+            else:
+                logger.debug(
+                    "[%s] IDLE timeout, restarting...", account.email
+                )
+
+    async def _fetch_async(
+        self,
+        imap,
+        account: EmailAccount,
+        notify: bool
+    ) -> None:
+        """
+        Fetch messages with aioimaplib and store relevant ones.
+
+        Pre-loading fetches the existing unseen messages; afterwards only
+        messages from the recorded UIDNEXT on are fetched.
+
+        Args:
+            imap: Authenticated aioimaplib.IMAP4_SSL client
+            account: EmailAccount being processed
+            notify: If True, fetch new messages and trigger the callback
+                    for each; if False, only pre-load unseen messages
+                    into storage
+        """
+        uid_next = self._uid_next.get(account.email)
+        if notify and uid_next is not None:
+            criteria = f"UID {uid_next}:*"
+        else:
+            criteria = "UNSEEN"
+
+        response = await imap.uid_search(criteria)
+        self._check_response(response, "SEARCH")
+        uids = response.lines[0].decode().split() if response.lines else []
+        if notify and uid_next is not None:
+            # "n:*" always matches the highest UID, even below n
+            uids = [uid for uid in uids if int(uid) >= uid_next]
+        if not uids:
+            return
+
+        # Decide on headers alone which bodies are worth downloading
+        headers = await self._uid_fetch_async(
+            imap,
+            uids,
+            "BODY.PEEK[HEADER]"
+        )
+        wanted_uids, skipped_uids = self._select_messages(headers, account)
+
+        mark_seen = notify and self.auto_mark_seen
+        if skipped_uids and mark_seen:
+            self._check_response(
+                await imap.uid(
+                    "store",
+                    ",".join(skipped_uids),
+                    "+FLAGS",
+                    "(\\Seen)"
+                ),
+                "STORE"
+            )
+
+        stored_count = 0
+        if wanted_uids:
+            # BODY[] marks the messages as seen, BODY.PEEK[] leaves them
+            messages = await self._uid_fetch_async(
+                imap,
+                wanted_uids,
+                "BODY[]" if mark_seen else "BODY.PEEK[]"
+            )
+            for uid, msg in messages:
+                # A malformed message is skipped, not retried forever
+                try:
+                    email_msg = self._store_message(msg)
+                except Exception as e:
+                    logger.error(
+                        f"[{account.email}] Cannot process message "
+                        f"UID {uid}: {e}",
+                        exc_info=True
+                    )
+                    continue
+                stored_count += 1
+                if notify:
+                    self._dispatch_callback(email_msg, account)
+
+        # Only now past the batch: if a fetch above failed, the next
+        # wakeup fetches the same messages again
+        if notify and uid_next is not None:
+            self._uid_next[account.email] = max(map(int, uids)) + 1
+
+        logger.info(
+            f"[{account.email}] Fetch complete: "
+            f"fetched {len(uids)} message(s), "
+            f"stored {stored_count} new message(s)"
+        )
+
+    async def _uid_fetch_async(
+        self,
+        imap,
+        uids: list[str],
+        item: str
+    ) -> list[tuple[str, MailMessage]]:
+        """
+        Fetch one message data item for several UIDs with aioimaplib.
+
+        Args:
+            imap: Authenticated aioimaplib.IMAP4_SSL client
+            uids: UIDs to fetch
+            item: FETCH data item returning a message literal,
+                  e.g. "BODY.PEEK[HEADER]"
+
+        Returns:
+            (UID, MailMessage) pairs parsed from the literals
+        """
+        response = await imap.uid("fetch", ",".join(uids), f"(UID {item})")
+        self._check_response(response, "FETCH")
+
+        # Literals are returned as bytearray, preceded by the status line
+        # carrying their UID
+        messages = []
+        uid = None
+        for line in response.lines:
+            if isinstance(line, bytearray):
+                messages.append((uid, MailMessage.from_bytes(bytes(line))))
+            else:
+                match = _FETCH_UID_RE.search(line)
+                uid = match.group(1).decode() if match else None
+        return messages
+
+    @staticmethod
+    def _check_response(response, command: str) -> None:
+        """
+        Raise if an aioimaplib command did not complete with OK.
+
+        Args:
+            response: aioimaplib Response
+            command: Command name for the error message
+
+        Raises:
+            RuntimeError: If the server did not answer OK
+        """
+        if response.result != "OK":
+            raise RuntimeError(
+                f"IMAP {command} failed: {response.result} {response.lines}"
+            )
+
     def _is_relevant_message(self, msg, account: EmailAccount) -> bool:
         """
         Check if a message is relevant for monitoring.
@@ -442,27 +1444,15 @@ class EmailThreadsMonitor:
         Returns:
             True if message should be processed, False otherwise
         """
-        # Check sender
-        sender = msg.from_
-
-        # Check recipients (to + cc)
-        recipients = set(msg.to)
-        if msg.cc:
-            recipients.update(msg.cc)
-
-        # Message is relevant ONLY if both sender and recipient
-        # are monitored accounts
-        from_monitored = sender in self.monitored_emails
-        to_monitored = bool(recipients & self.monitored_emails)
-
-        is_relevant = from_monitored and to_monitored
+        # Rejects on the sender first, as most mail comes from outside
+        emails = self.monitored_emails
+        is_relevant = msg.from_ in emails and (
+            not emails.isdisjoint(msg.to) or not emails.isdisjoint(msg.cc)
+        )
 
         logger.debug(
-            f"[{account.email}] Relevance check: "
-            f"from={sender}, to={list(recipients)}, "
-            f"from_monitored={from_monitored}, "
-            f"to_monitored={to_monitored}, "
-            f"relevant={is_relevant}"
+            "[%s] Relevance check: from=%s, to=%s, cc=%s, relevant=%s",
+            account.email, msg.from_, msg.to, msg.cc, is_relevant
         )
 
         return is_relevant
@@ -478,39 +1468,108 @@ class EmailThreadsMonitor:
             EmailMessage instance
         """
         # Extract References header
-        references = []
-        if msg.headers.get("references"):
-            refs_str = msg.headers.get("references")[0]
-            # Split by whitespace and filter empty strings
-            references = [
-                ref.strip() for ref in refs_str.split()
-                if ref.strip()
-            ]
+        headers = msg.headers
+        references = _EMPTY
+        refs = headers.get("references")
+        if refs:
+            # Pick out the <...> tokens in a single pass
+            references = _MSGID_RE.findall(refs[0])
 
         # Extract In-Reply-To
         in_reply_to = None
-        if msg.headers.get("in-reply-to"):
-            in_reply_to = msg.headers.get("in-reply-to")[0].strip()
+        reply_to = headers.get("in-reply-to")
+        if reply_to:
+            in_reply_to = reply_to[0].strip()
+
+        from_, to, cc, bcc = msg.from_, msg.to, msg.cc, msg.bcc
+        if self.intern_addresses:
+            # The same few addresses recur across stored messages
+            from_ = sys.intern(from_)
+            to = self._intern_addresses(to)
+            cc = self._intern_addresses(cc)
+            bcc = self._intern_addresses(bcc)
 
         # Create EmailMessage
         email_msg = EmailMessage(
-            message_id=msg.headers.get("message-id", [""])[0].strip(),
-            from_=msg.from_,
-            to=list(msg.to),
+            message_id=_extract_msgid(msg),
+            from_=from_,
+            # imap_tools returns immutable tuples, stored without copying
+            to=to,
             subject=msg.subject or "",
             text=msg.text or "",
-            html=msg.html or None,
+            html=msg.html if msg.html else None,
             date=msg.date,
             in_reply_to=in_reply_to,
             references=references,
-            cc=list(msg.cc) if msg.cc else [],
-            bcc=list(msg.bcc) if msg.bcc else [],
-            raw_headers=dict(msg.headers)
+            cc=cc or _EMPTY,
+            bcc=bcc or _EMPTY,
+            # imap_tools builds a plain dict of str tuples for the
+            # message, which is dropped after conversion: keep that dict
+            # instead of copying it
+            raw_headers=headers
         )
 
         logger.debug(
-            f"Converted message: {email_msg.message_id[:30]}... "
-            f"(has_reply_to={email_msg.is_reply()})"
+            "Converted message: %.30s... (has_reply_to=%s)",
+            email_msg.message_id, email_msg.in_reply_to is not None
         )
 
         return email_msg
+
+    def _intern_addresses(self, addresses: tuple[str, ...]) -> tuple[str, ...]:
+        """
+        Get the interned copy of a tuple of addresses.
+
+        Messages with the same recipients share one tuple of interned
+        strings; the temporary tuple built for each message is dropped
+        right away.
+
+        Args:
+            addresses: Addresses as returned by imap_tools
+
+        Returns:
+            Shared tuple of interned addresses
+        """
+        if not addresses:
+            return _EMPTY
+
+        # Keyed by the interned tuple itself, so the cache holds a
+        # single tuple per distinct set of recipients
+        interned = tuple(map(sys.intern, addresses))
+        if len(self._address_tuples) >= ADDRESS_CACHE_SIZE:
+            self._address_tuples.clear()
+        return self._address_tuples.setdefault(interned, interned)
+
+
+def _run_partition(
+    accounts: list[EmailAccount],
+    auto_mark_seen: bool,
+    intern_addresses: bool,
+    results: multiprocessing.Queue,
+    stop_event
+) -> None:
+    """
+    Monitor one shard of accounts in a start_multiproc() worker process.
+
+    Each new message is put on the results queue together with its reply
+    chain instead of being passed to a callback.
+
+    Args:
+        accounts: Accounts of this shard
+        auto_mark_seen: Passed through to EmailThreadsMonitor
+        intern_addresses: Passed through to EmailThreadsMonitor
+        results: Queue receiving (message, reply_chain) tuples
+        stop_event: multiprocessing.Event set by the parent's stop()
+    """
+    monitor = EmailThreadsMonitor(
+        accounts,
+        lambda message, chain: results.put((message, chain)),
+        auto_mark_seen=auto_mark_seen,
+        intern_addresses=intern_addresses
+    )
+    # Ctrl+C reaches the whole process group; the parent stops us
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+    monitor.start_async()
+    stop_event.wait()
+    monitor.stop()
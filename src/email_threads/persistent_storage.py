@@ -0,0 +1,290 @@
+"""SQLite-backed persistent message storage module."""
+
+import json
+import logging
+import sqlite3
+from datetime import datetime
+from itertools import islice
+from threading import Lock
+from typing import Iterable, Iterator, Optional
+
+from .message import EmailMessage
+from .storage import MessageStorage
+
+logger = logging.getLogger(__name__)
+
+# Message-IDs bound per "IN (...)" query, well below SQLite's limit on
+# host parameters
+_QUERY_BATCH_SIZE = 500
+
+
+class PersistentMessageStorage(MessageStorage):
+    """
+    Message storage persisted to an SQLite database.
+
+    Messages survive restarts, so a monitor given this storage skips
+    downloading messages it already processed in an earlier run (they
+    are recognized from their headers alone). Stored messages live in
+    the database rather than in memory; get() loads a fresh copy each
+    time.
+
+    The database uses write-ahead logging, so a crash loses at most the
+    last transactions instead of corrupting the file. Messages are
+    stored as JSON objects of their fields.
+
+    Uses only the standard library. Like MessageStorage, it is safe to
+    use from multiple threads, and listeners registered with
+    add_listener() and add_clear_listener() are notified after every
+    add() and clear().
+    """
+
+    def __init__(self, path: str):
+        """
+        Open (or create) the storage database.
+
+        Args:
+            path: Path of the SQLite database file
+        """
+        # The in-memory shards of the base class stay unused
+        super().__init__(max_size=None)
+
+        # One connection shared by all threads, serialized by the lock
+        self._lock = Lock()
+        self._conn = sqlite3.connect(
+            path,
+            check_same_thread=False,
+            isolation_level=None
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        # With WAL, NORMAL only risks the latest commits on power loss
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS messages ("
+            "message_id TEXT PRIMARY KEY, "
+            "data TEXT NOT NULL"
+            ") WITHOUT ROWID"
+        )
+        logger.debug("PersistentMessageStorage opened: %s", path)
+
+    def add(self, message: EmailMessage) -> None:
+        """
+        Add a message to storage.
+
+        If a message with the same Message-ID already exists,
+        it will be replaced with the new message. Registered listeners
+        are notified once the message is stored.
+
+        Args:
+            message: EmailMessage instance to store
+
+        Raises:
+            ValueError: If message is None or has empty message_id
+        """
+        if message is None:
+            raise ValueError("Cannot add None message to storage")
+
+        if not message.message_id:
+            raise ValueError("Cannot add message with empty message_id")
+
+        data = _encode(message)
+
+        with self._lock:
+            replaced = self._conn.execute(
+                "SELECT 1 FROM messages WHERE message_id = ?",
+                (message.message_id,)
+            ).fetchone() is not None
+            self._conn.execute(
+                "INSERT OR REPLACE INTO messages (message_id, data) "
+                "VALUES (?, ?)",
+                (message.message_id, data)
+            )
+
+        logger.debug(
+            "Message added to storage: %.30s...", message.message_id
+        )
+
+        self._notify_listeners(message, replaced)
+
+    def get(self, message_id: str) -> Optional[EmailMessage]:
+        """
+        Retrieve a message by its Message-ID.
+
+        Args:
+            message_id: The Message-ID to lookup
+
+        Returns:
+            EmailMessage if found, None otherwise
+        """
+        if not message_id:
+            logger.warning("Attempted to get message with empty message_id")
+            return None
+
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT data FROM messages WHERE message_id = ?",
+                (message_id,)
+            ).fetchone()
+
+        if row is None:
+            logger.debug("Message not found in storage: %.30s...", message_id)
+            return None
+
+        logger.debug("Message found in storage: %.30s...", message_id)
+        return _decode(row[0])
+
+    def exists(self, message_id: str) -> bool:
+        """
+        Check if a message exists in storage.
+
+        Args:
+            message_id: The Message-ID to check
+
+        Returns:
+            True if message exists, False otherwise
+        """
+        if not message_id:
+            return False
+
+        with self._lock:
+            return self._conn.execute(
+                "SELECT 1 FROM messages WHERE message_id = ?",
+                (message_id,)
+            ).fetchone() is not None
+
+    def exists_strict(self, message_id: str) -> bool:
+        """
+        Check if a message exists in storage.
+
+        Same as exists(), which already queries under the lock.
+
+        Args:
+            message_id: The Message-ID to check
+
+        Returns:
+            True if message exists, False otherwise
+        """
+        return self.exists(message_id)
+
+    def exists_many(self, message_ids: Iterable[str]) -> set[str]:
+        """
+        Check which of several Message-IDs exist in storage.
+
+        The IDs are looked up with a few batched queries instead of one
+        query per Message-ID.
+
+        Args:
+            message_ids: The Message-IDs to check
+
+        Returns:
+            Set of the given Message-IDs that are already stored
+        """
+        ids = iter({message_id for message_id in message_ids if message_id})
+        found = set()
+
+        with self._lock:
+            while batch := list(islice(ids, _QUERY_BATCH_SIZE)):
+                placeholders = ",".join("?" * len(batch))
+                found.update(
+                    row[0] for row in self._conn.execute(
+                        f"SELECT message_id FROM messages "
+                        f"WHERE message_id IN ({placeholders})",
+                        batch
+                    )
+                )
+
+        return found
+
+    def get_all_message_ids(self) -> list[str]:
+        """
+        Get all Message-IDs currently in storage.
+
+        Returns:
+            List of all Message-IDs
+        """
+        with self._lock:
+            return [
+                row[0] for row in
+                self._conn.execute("SELECT message_id FROM messages")
+            ]
+
+    def iter_message_ids(self) -> Iterator[str]:
+        """
+        Iterate over the Message-IDs currently in storage.
+
+        Returns:
+            Iterator over a snapshot of the Message-IDs
+        """
+        return iter(self.get_all_message_ids())
+
+    def count(self) -> int:
+        """
+        Get the total number of messages in storage.
+
+        Returns:
+            Number of stored messages
+        """
+        with self._lock:
+            return self._conn.execute(
+                "SELECT COUNT(*) FROM messages"
+            ).fetchone()[0]
+
+    def clear(self) -> None:
+        """
+        Remove all messages from storage.
+
+        This is useful for testing or resetting the storage state.
+        """
+        with self._lock:
+            count = self._conn.execute("DELETE FROM messages").rowcount
+        logger.info("Storage cleared (%d messages removed)", count)
+
+        for listener in self._clear_listeners:
+            listener()
+
+    def close(self) -> None:
+        """Close the database. The storage cannot be used afterwards."""
+        with self._lock:
+            self._conn.close()
+
+
+def _encode(message: EmailMessage) -> str:
+    """Serialize the fields of a message to JSON."""
+    return json.dumps({
+        "message_id": message.message_id,
+        "from_": message.from_,
+        "to": list(message.to),
+        "subject": message.subject,
+        "text": message.text,
+        "html": message.html,
+        "date": message.date.isoformat(),
+        "in_reply_to": message.in_reply_to,
+        "references": list(message.references),
+        "cc": list(message.cc),
+        "bcc": list(message.bcc),
+        "raw_headers": message.raw_headers,
+    })
+
+
+def _decode(data: str) -> EmailMessage:
+    """Rebuild a message serialized by _encode()."""
+    fields = json.loads(data)
+    raw_headers = fields["raw_headers"]
+    if raw_headers is not None:
+        # imap_tools header values are tuples, JSON gives lists
+        raw_headers = {
+            name: tuple(values) for name, values in raw_headers.items()
+        }
+    return EmailMessage(
+        message_id=fields["message_id"],
+        from_=fields["from_"],
+        to=tuple(fields["to"]),
+        subject=fields["subject"],
+        text=fields["text"],
+        html=fields["html"],
+        date=datetime.fromisoformat(fields["date"]),
+        in_reply_to=fields["in_reply_to"],
+        references=tuple(fields["references"]),
+        cc=tuple(fields["cc"]),
+        bcc=tuple(fields["bcc"]),
+        raw_headers=raw_headers
+    )
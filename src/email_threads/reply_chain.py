@@ -1,6 +1,8 @@
 """Reply chain building module."""
 
 import logging
+from collections import OrderedDict
+from threading import Lock
 from typing import Optional
 
 from .message import EmailMessage
@@ -8,6 +10,42 @@ from .storage import MessageStorage
 
 logger = logging.getLogger(__name__)
 
+# Most reply chains kept cached; the least recently used one is dropped
+# beyond this, also when the storage itself is unbounded
+CHAIN_CACHE_SIZE = 10_000
+
+
+class _ChainNode:
+    """
+    Cached reply chain ending at one message.
+
+    Nodes link to their parent's node, so the chains of a thread share
+    their common part instead of each holding a copy of it.
+    """
+
+    __slots__ = ("message", "parent", "root", "length")
+
+    def __init__(self, message: EmailMessage, parent: Optional["_ChainNode"]):
+        self.message = message
+        self.parent = parent
+        if parent is None:
+            self.root = message
+            self.length = 1
+        else:
+            self.root = parent.root
+            self.length = parent.length + 1
+
+    def to_list(self) -> list[EmailMessage]:
+        """Get the chain in chronological order (oldest first)."""
+        chain = [self.message] * self.length
+        node = self.parent
+        index = self.length - 1
+        while node is not None:
+            index -= 1
+            chain[index] = node.message
+            node = node.parent
+        return chain
+
 
 class ReplyChainBuilder:
     """
@@ -20,6 +58,13 @@ class ReplyChainBuilder:
     If a parent message is not found in storage (e.g., it was sent
     before monitoring started), the chain will still be built with
     the available messages.
+
+    Built chains are memoized by Message-ID. Since threads only grow by
+    appending replies, the chain of a new reply is usually its parent's
+    cached chain plus the reply itself, without walking to the root.
+    Each cached chain links to its parent's, so a thread of n messages
+    takes O(n) cache memory, and thread roots and lengths are known
+    without building a list. At most CHAIN_CACHE_SIZE chains are kept.
     """
 
     def __init__(self, storage: MessageStorage):
@@ -30,6 +75,12 @@ class ReplyChainBuilder:
             storage: MessageStorage instance to lookup messages
         """
         self.storage = storage
+        # Least recently used chain first, guarded by _cache_lock
+        self._chain_cache: OrderedDict[str, _ChainNode] = OrderedDict()
+        self._cache_lock = Lock()
+        storage.add_listener(self._on_message_added)
+        storage.add_eviction_listener(self._on_message_evicted)
+        storage.add_clear_listener(self._on_storage_cleared)
         logger.debug("ReplyChainBuilder initialized")
 
     def build_chain(self, message: EmailMessage) -> list[EmailMessage]:
@@ -51,26 +102,109 @@ class ReplyChainBuilder:
             logger.warning("Cannot build chain for None message")
             return []
 
+        return self._get_chain(message).to_list()
+
+    def get_thread_root(self, message: EmailMessage) -> Optional[EmailMessage]:
+        """
+        Find the root message of a thread.
+
+        The root message is the first message in the conversation
+        (the one with no In-Reply-To header).
+
+        Args:
+            message: Any message in the thread
+
+        Returns:
+            The root EmailMessage, or None if not found
+        """
+        if message is None:
+            return None
+        return self._get_chain(message).root
+
+    def get_thread_length(self, message: EmailMessage) -> int:
+        """
+        Get the total number of messages in a thread.
+
+        Args:
+            message: Any message in the thread
+
+        Returns:
+            Number of messages in the thread
+        """
+        if message is None:
+            return 0
+        return self._get_chain(message).length
+
+    def _get_chain(self, message: EmailMessage) -> _ChainNode:
+        """
+        Get the chain for a message from the cache, building it on a miss.
+
+        Args:
+            message: The message to build a chain for
+
+        Returns:
+            Node of the chain ending at message
+        """
+        node = self._cached_chain(message.message_id)
+        if node is not None:
+            return node
+
         logger.debug(
-            f"Building reply chain for message: "
-            f"{message.message_id[:30]}..."
+            "Building reply chain for message: %.30s...", message.message_id
         )
 
+        # Extend the parent's cached chain by one when possible
+        parent_node = None
+        if message.in_reply_to and self.storage.exists(message.in_reply_to):
+            parent_node = self._cached_chain(message.in_reply_to)
+
+        if parent_node is not None:
+            node = _ChainNode(message, parent_node)
+            cacheable = True
+        else:
+            chain, cacheable = self._walk_chain(message)
+            for current in chain:
+                node = _ChainNode(current, node)
+
+        if cacheable:
+            with self._cache_lock:
+                self._chain_cache[message.message_id] = node
+                self._chain_cache.move_to_end(message.message_id)
+                if len(self._chain_cache) > CHAIN_CACHE_SIZE:
+                    self._chain_cache.popitem(last=False)
+
+        logger.info(
+            f"Reply chain built: {node.length} message(s) "
+            f"for {message.message_id[:30]}..."
+        )
+
+        return node
+
+    def _walk_chain(
+        self,
+        message: EmailMessage
+    ) -> tuple[list[EmailMessage], bool]:
+        """
+        Build a chain by walking parent pointers up to the root.
+
+        Args:
+            message: The message to build a chain for
+
+        Returns:
+            Tuple of (chain in chronological order, cacheable), where
+            cacheable is False if a circular reference cut the walk short
+        """
         # Collect all messages in the chain (newest to oldest)
         chain_reversed = []
         current = message
-        visited = set()  # Prevent infinite loops
+
+        # Floyd's cycle detection: the tortoise is read back from the
+        # collected list at half the walk's pace, so a circular reference
+        # is caught without hashing every hop
+        check_tortoise = False
+        cacheable = True
 
         while current is not None:
-            # Check for circular reference
-            if current.message_id in visited:
-                logger.warning(
-                    f"Circular reference detected in reply chain: "
-                    f"{current.message_id[:30]}..."
-                )
-                break
-
-            visited.add(current.message_id)
             chain_reversed.append(current)
 
             # Try to find parent message
@@ -78,14 +212,13 @@ class ReplyChainBuilder:
                 parent = self.storage.get(current.in_reply_to)
                 if parent:
                     logger.debug(
-                        f"Found parent message: "
-                        f"{parent.message_id[:30]}..."
+                        "Found parent message: %.30s...", parent.message_id
                     )
                     current = parent
                 else:
                     logger.debug(
-                        f"Parent message not found in storage: "
-                        f"{current.in_reply_to[:30]}..."
+                        "Parent message not found in storage: %.30s...",
+                        current.in_reply_to
                     )
                     current = None
             else:
@@ -93,42 +226,96 @@ class ReplyChainBuilder:
                 logger.debug("Reached root message (no in_reply_to)")
                 current = None
 
-        # Reverse to get chronological order (oldest to newest)
-        chain = list(reversed(chain_reversed))
+            # Check for circular reference
+            check_tortoise = not check_tortoise
+            if check_tortoise and current is not None:
+                tortoise = chain_reversed[len(chain_reversed) // 2]
+                if current.message_id == tortoise.message_id:
+                    logger.warning(
+                        f"Circular reference detected in reply chain: "
+                        f"{current.message_id[:30]}..."
+                    )
+                    self._truncate_cycle(chain_reversed)
+                    cacheable = False
+                    break
 
-        logger.info(
-            f"Reply chain built: {len(chain)} message(s) "
-            f"for {message.message_id[:30]}..."
-        )
+        # Reverse in place to get chronological order (oldest to newest)
+        chain_reversed.reverse()
+        return chain_reversed, cacheable
 
-        return chain
+    @staticmethod
+    def _truncate_cycle(chain_reversed: list[EmailMessage]) -> None:
+        """
+        Cut a walk that ran into a cycle at the first repeated message.
 
-    def get_thread_root(self, message: EmailMessage) -> Optional[EmailMessage]:
+        Floyd's check notices the cycle a few hops after entering it;
+        this rare path drops the messages collected twice.
+
+        Args:
+            chain_reversed: Walked messages (newest to oldest), modified
+                            in place
         """
-        Find the root message of a thread.
+        seen = set()
+        for index, current in enumerate(chain_reversed):
+            if current.message_id in seen:
+                del chain_reversed[index:]
+                return
+            seen.add(current.message_id)
 
-        The root message is the first message in the conversation
-        (the one with no In-Reply-To header).
+    def _cached_chain(self, message_id: str) -> Optional[_ChainNode]:
+        """
+        Look up a cached chain, dropping it if it has become stale.
+
+        A chain that stopped at a missing parent is stale once that
+        parent arrives in storage.
 
         Args:
-            message: Any message in the thread
+            message_id: Message-ID of the last message in the chain
 
         Returns:
-            The root EmailMessage, or None if not found
+            Node of the cached chain, or None if not cached or stale
         """
-        chain = self.build_chain(message)
-        if chain:
-            return chain[0]
-        return None
+        with self._cache_lock:
+            node = self._chain_cache.get(message_id)
+            if node is None:
+                return None
+            self._chain_cache.move_to_end(message_id)
 
-    def get_thread_length(self, message: EmailMessage) -> int:
+        root = node.root
+        if root.in_reply_to and self.storage.exists(root.in_reply_to):
+            with self._cache_lock:
+                self._chain_cache.pop(message_id, None)
+            return None
+
+        return node
+
+    def _on_message_added(self, message: EmailMessage, replaced: bool) -> None:
         """
-        Get the total number of messages in a thread.
+        Storage listener invalidating chains that may hold a stale message.
 
         Args:
-            message: Any message in the thread
+            message: Message that was stored
+            replaced: True if it replaced a message with the same Message-ID
+        """
+        if replaced:
+            # The old object may sit anywhere in any cached chain
+            self._on_storage_cleared()
 
-        Returns:
-            Number of messages in the thread
+    def _on_message_evicted(self, message_id: str) -> None:
         """
-        return len(self.build_chain(message))
+        Storage listener dropping the chain of an evicted message.
+
+        Keeps the cache from growing past the storage bound. Chains of
+        replies may still hold the evicted message, which is fine: it
+        is still part of their thread.
+
+        Args:
+            message_id: Message-ID of the evicted message
+        """
+        with self._cache_lock:
+            self._chain_cache.pop(message_id, None)
+
+    def _on_storage_cleared(self) -> None:
+        """Storage listener dropping every cached chain."""
+        with self._cache_lock:
+            self._chain_cache.clear()
@@ -2,17 +2,222 @@
 
 import logging
 import smtplib
+import socket
 import ssl
+import threading
+import time
 import uuid
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from io import BytesIO
+from email.generator import BytesGenerator
+from email.mime.base import MIMEBase
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
-from typing import Optional
+from typing import Callable, Optional
 
 from .account import EmailAccount
 from .message import EmailMessage
 
 logger = logging.getLogger(__name__)
 
+# Pooled SMTP connections unused for longer than this are closed
+# (seconds); servers commonly drop idle clients after a few minutes
+SMTP_IDLE_TIMEOUT = 100
+
+# How often the reaper thread looks for idle connections (seconds)
+SMTP_REAP_INTERVAL = 10
+
+# Upper bound on connections send_many() uses in parallel
+SEND_MANY_MAX_WORKERS = 15
+
+# Attempts per email when the failure is transient; attempt n waits
+# 2 ** n seconds before the next one
+SEND_MAX_ATTEMPTS = 3
+
+
+def _is_transient(error: BaseException) -> bool:
+    """
+    Check whether a send failure is worth retrying.
+
+    Lost connections, timeouts and 4xx replies are transient. Other
+    replies (5xx) and refused recipients are permanent: retrying would
+    fail the same way.
+    """
+    if isinstance(error, smtplib.SMTPRecipientsRefused):
+        return False
+    if isinstance(error, smtplib.SMTPResponseException):
+        # Also covers SMTPConnectError, SMTPDataError and friends
+        return 400 <= error.smtp_code < 500
+    if isinstance(error, smtplib.SMTPServerDisconnected):
+        return True
+    if isinstance(error, smtplib.SMTPException):
+        return False
+    if isinstance(error, socket.gaierror):
+        # Unknown host, unless the resolver itself is unavailable
+        return error.errno == socket.EAI_AGAIN
+    # Socket level failures: timeouts, resets, unreachable host
+    return isinstance(error, OSError)
+
+
+def _is_connection_error(error: BaseException) -> bool:
+    """
+    Check whether a send failure happened while connecting or logging in.
+
+    Such failures do not depend on the message being sent, so every
+    other message sent the same way would fail too.
+    """
+    if isinstance(error, (
+        smtplib.SMTPAuthenticationError,
+        smtplib.SMTPConnectError,
+        smtplib.SMTPHeloError,
+        smtplib.SMTPNotSupportedError,
+    )):
+        return True
+    # Socket level failures: resolution, refused connection, TLS
+    return (
+        isinstance(error, OSError)
+        and not isinstance(error, smtplib.SMTPException)
+    )
+
+
+@dataclass(slots=True)
+class SendSpec:
+    """
+    One email to send with EmailSender.send_many().
+
+    The attributes mirror the arguments of EmailSender.send().
+
+    Attributes:
+        to: Recipient email address
+        subject: Email subject
+        text: Plain text content
+        html: HTML content (optional)
+        reply_to_message: If this is a reply, the original message
+        cc: CC recipients (optional)
+        bcc: BCC recipients (optional)
+    """
+
+    to: str
+    subject: str
+    text: str
+    html: Optional[str] = None
+    reply_to_message: Optional[EmailMessage] = None
+    cc: Optional[list[str]] = None
+    bcc: Optional[list[str]] = None
+
+
+class _SMTPConnectionPool:
+    """
+    Cache of logged-in SMTP connections shared by all senders.
+
+    Connections are keyed by (server, port, ssl, email), checked out for
+    one send and checked back in afterwards, so consecutive sends skip
+    the TLS handshake and AUTH. A daemon thread closes connections that
+    stayed idle for more than SMTP_IDLE_TIMEOUT seconds.
+    """
+
+    def __init__(self):
+        self._idle: dict[tuple, deque[tuple[smtplib.SMTP, float]]] = {}
+        self._lock = threading.Lock()
+        self._reaper: Optional[threading.Thread] = None
+
+    def checkout(
+        self,
+        key: tuple,
+        connect: Callable[[], smtplib.SMTP]
+    ) -> smtplib.SMTP:
+        """
+        Take an idle connection for key, or open one with connect().
+
+        Args:
+            key: (server, port, ssl, email) of the connection
+            connect: Opens and logs in a new connection
+
+        Returns:
+            Connection owned by the caller until checkin() or discard()
+        """
+        expired = []
+        server = None
+        with self._lock:
+            idle = self._idle.get(key)
+            now = time.monotonic()
+            # Most recently used first, it is the least likely to be
+            # dropped by the server
+            while idle:
+                candidate, last_used = idle.pop()
+                if now - last_used < SMTP_IDLE_TIMEOUT:
+                    server = candidate
+                    break
+                expired.append(candidate)
+
+        for candidate in expired:
+            self.discard(candidate)
+
+        if server is not None:
+            logger.debug("Reusing pooled SMTP connection")
+            return server
+        return connect()
+
+    def checkin(self, key: tuple, server: smtplib.SMTP) -> None:
+        """
+        Return a healthy connection to the pool.
+
+        Args:
+            key: Key the connection was checked out with
+            server: Connection to keep for later sends
+        """
+        with self._lock:
+            self._idle.setdefault(key, deque()).append(
+                (server, time.monotonic())
+            )
+            if self._reaper is None:
+                self._reaper = threading.Thread(
+                    target=self._reap,
+                    daemon=True,
+                    name="SMTP-reaper"
+                )
+                self._reaper.start()
+
+    @staticmethod
+    def discard(server: smtplib.SMTP) -> None:
+        """Close a connection, ignoring errors from a broken session."""
+        try:
+            server.quit()
+        except Exception:
+            server.close()
+        logger.debug("SMTP connection closed")
+
+    def _reap(self) -> None:
+        """Close idle connections until the pool is empty."""
+        while True:
+            time.sleep(SMTP_REAP_INTERVAL)
+
+            expired = []
+            with self._lock:
+                now = time.monotonic()
+                for key, idle in list(self._idle.items()):
+                    # Oldest first, stop at the first one still fresh
+                    while idle and now - idle[0][1] >= SMTP_IDLE_TIMEOUT:
+                        expired.append(idle.popleft()[0])
+                    if not idle:
+                        del self._idle[key]
+
+                # Nothing left to watch, checkin() starts a new reaper
+                done = not self._idle
+                if done:
+                    self._reaper = None
+
+            for server in expired:
+                self.discard(server)
+
+            if done:
+                return
+
+
+_smtp_pool = _SMTPConnectionPool()
+
 
 class EmailSender:
     """
@@ -23,6 +228,13 @@ class EmailSender:
     for maintaining conversation threads.
     """
 
+    # Create SSL context once (less strict for compatibility); contexts
+    # are safe to share between connections and threads
+    _SSL_CTX = ssl.create_default_context()
+    # Allow older protocols for QQ mail compatibility
+    _SSL_CTX.check_hostname = False
+    _SSL_CTX.verify_mode = ssl.CERT_NONE
+
     def __init__(self, account: EmailAccount):
         """
         Initialize email sender with an account.
@@ -40,6 +252,8 @@ class EmailSender:
             )
 
         self.account = account
+        # Domain part of generated Message-IDs, fixed per account
+        self._msgid_domain = account.email.rpartition("@")[2]
         logger.info(f"EmailSender initialized for {account.email}")
 
     def send(
@@ -75,49 +289,279 @@ class EmailSender:
             f"{subject[:50]}..."
         )
 
-        # Create message
-        msg = MIMEMultipart("alternative")
+        raw, message_id = self._build_message(
+            SendSpec(to, subject, text, html, reply_to_message, cc, bcc)
+        )
+
+        # Send via SMTP
+        try:
+            self._send_via_smtp(raw, to, cc, bcc)
+            logger.info(f"Email sent successfully: {message_id}")
+        except Exception as e:
+            logger.error(f"Failed to send email: {e}", exc_info=True)
+            raise
+
+        return message_id
+
+    def send_many(self, items: list[SendSpec]) -> list[Optional[str]]:
+        """
+        Send several emails over a few reused SMTP connections.
+
+        All messages are built first. They are then split across at
+        most SEND_MANY_MAX_WORKERS threads, each sending its share back
+        to back over one pooled connection, so the TLS handshake and
+        login are paid once per thread instead of once per email.
+
+        A failed item does not stop the batch: it is logged and its
+        result is None. Failing to connect or log in is different: the
+        items not sent yet are not attempted, and fail too.
+
+        Args:
+            items: Emails to send
+
+        Returns:
+            Generated Message-ID of each item, in order, or None for
+            items that could not be sent
+        """
+        logger.info(
+            f"Sending {len(items)} email(s) from {self.account.email}"
+        )
+
+        prepared = []
+        for spec in items:
+            raw, message_id = self._build_message(spec)
+            recipients = self._collect_recipients(spec.to, spec.cc, spec.bcc)
+            prepared.append((raw, message_id, recipients))
+
+        results: list[Optional[str]] = [None] * len(items)
+        workers = min(SEND_MANY_MAX_WORKERS, len(prepared))
+        if workers:
+            # Log in once before fanning out, so a wrong password or an
+            # unreachable server costs one failed attempt, not one per
+            # worker. The connection goes back to the pool for a worker
+            key = self._pool_key()
+            try:
+                _smtp_pool.checkin(key, self._checkout_with_retries(key))
+            except Exception as e:
+                logger.error(
+                    f"Cannot connect to send {len(items)} email(s): {e}",
+                    exc_info=True
+                )
+                workers = 0
+
+        if workers:
+            # Workers open connections one at a time, and the first one
+            # failing to connect stops the others from trying
+            connect_lock = threading.Lock()
+            abort = threading.Event()
+            with ThreadPoolExecutor(
+                max_workers=workers,
+                thread_name_prefix="Sender-worker"
+            ) as executor:
+                for shard in range(workers):
+                    executor.submit(
+                        self._send_shard,
+                        prepared,
+                        range(shard, len(prepared), workers),
+                        results,
+                        connect_lock,
+                        abort
+                    )
+
+        sent = sum(result is not None for result in results)
+        logger.info(f"Sent {sent}/{len(items)} email(s)")
+        return results
+
+    def _send_shard(
+        self,
+        prepared: list[tuple[bytes, str, list[str]]],
+        indexes: range,
+        results: list[Optional[str]],
+        connect_lock: threading.Lock,
+        abort: threading.Event
+    ) -> None:
+        """
+        Send part of a send_many() batch over one pooled connection.
+
+        Connections are opened under connect_lock. If connecting or
+        logging in fails for good, abort is set and every worker gives
+        up the rest of its part, rather than failing the same way once
+        per item (and risking an account lockout after repeated failed
+        logins).
+
+        Args:
+            prepared: (message, Message-ID, recipients) of the batch
+            indexes: Positions in prepared handled by this worker
+            results: Filled with the Message-ID of each item sent
+            connect_lock: Serializes connecting across the batch
+            abort: Set once connecting failed for good
+        """
+        key = self._pool_key()
+        server = None
+
+        for position, index in enumerate(indexes):
+            raw, message_id, recipients = prepared[index]
+            for attempt in range(SEND_MAX_ATTEMPTS):
+                try:
+                    if server is None:
+                        server = self._batch_checkout(
+                            key, connect_lock, abort
+                        )
+                        if server is None:
+                            logger.debug(
+                                "Giving up %d email(s) after a "
+                                "connection failure",
+                                len(indexes) - position
+                            )
+                            return
+                    server, refused = self._deliver(server, raw, recipients)
+                    break
+                except Exception as e:
+                    # The connection was discarded, open another one
+                    server = None
+                    if (attempt == SEND_MAX_ATTEMPTS - 1
+                            or not _is_transient(e)):
+                        if _is_connection_error(e):
+                            abort.set()
+                            logger.error(
+                                f"Cannot connect to send "
+                                f"{len(indexes) - position} email(s): {e}",
+                                exc_info=True
+                            )
+                            return
+                        logger.error(
+                            f"Failed to send email {message_id}: {e}",
+                            exc_info=True
+                        )
+                        break
+                    delay = 2 ** attempt
+                    logger.warning(
+                        f"Transient SMTP failure sending {message_id} "
+                        f"({e}), retrying in {delay}s"
+                    )
+                    time.sleep(delay)
+            if server is None:
+                # Gave up on this item
+                continue
+
+            if refused is not None:
+                logger.error(
+                    f"Failed to send email {message_id}: {refused}"
+                )
+                continue
+
+            results[index] = message_id
+            logger.debug("Email sent: %s", message_id)
+
+        if server is not None:
+            _smtp_pool.checkin(key, server)
+
+    def _batch_checkout(
+        self,
+        key: tuple,
+        connect_lock: threading.Lock,
+        abort: threading.Event
+    ) -> Optional[smtplib.SMTP]:
+        """
+        Check out a connection for a send_many() worker.
+
+        A permanent connection failure sets abort before connect_lock
+        is released, so no other worker of the batch tries next.
+
+        Args:
+            key: Pool key from _pool_key()
+            connect_lock: Serializes connecting across the batch
+            abort: Set once connecting failed for good
+
+        Returns:
+            Authenticated SMTP connection, or None if abort is set
+
+        Raises:
+            smtplib.SMTPException: If connection or login fails
+        """
+        with connect_lock:
+            if abort.is_set():
+                return None
+            try:
+                return _smtp_pool.checkout(key, self._open_connection)
+            except Exception as e:
+                if _is_connection_error(e) and not _is_transient(e):
+                    abort.set()
+                raise
+
+    def _checkout_with_retries(self, key: tuple) -> smtplib.SMTP:
+        """
+        Check out a connection, retrying transient failures with backoff.
+
+        Args:
+            key: Pool key from _pool_key()
+
+        Returns:
+            Authenticated SMTP connection
+
+        Raises:
+            smtplib.SMTPException: If connection or login fails
+        """
+        for attempt in range(SEND_MAX_ATTEMPTS):
+            try:
+                return _smtp_pool.checkout(key, self._open_connection)
+            except Exception as e:
+                if attempt == SEND_MAX_ATTEMPTS - 1 or not _is_transient(e):
+                    raise
+                delay = 2 ** attempt
+                logger.warning(
+                    f"Transient SMTP failure connecting ({e}), "
+                    f"retrying in {delay}s"
+                )
+                time.sleep(delay)
+
+    def _build_message(self, spec: SendSpec) -> tuple[bytes, str]:
+        """
+        Build the MIME message for an email, serialized for sending.
+
+        The message is flattened once here, so retries and batches do
+        not walk the MIME tree again. Bcc recipients only go into the
+        envelope: a Bcc header would be sent to every recipient.
+
+        Args:
+            spec: Email to build
+
+        Returns:
+            Tuple of (message bytes with CRLF line endings,
+            generated Message-ID)
+        """
+        # Create message: a single text part unless there is HTML too
+        if spec.html:
+            msg = MIMEMultipart("alternative")
+            msg.attach(MIMEText(spec.text, "plain", "utf-8"))
+            msg.attach(MIMEText(spec.html, "html", "utf-8"))
+        else:
+            msg = MIMEText(spec.text, "plain", "utf-8")
+
         msg["From"] = self.account.email
-        msg["To"] = to
-        msg["Subject"] = subject
+        msg["To"] = spec.to
+        msg["Subject"] = spec.subject
 
         # Generate unique Message-ID
         message_id = self._generate_message_id()
         msg["Message-ID"] = message_id
-        logger.debug(f"Generated Message-ID: {message_id}")
+        logger.debug("Generated Message-ID: %s", message_id)
 
-        # Add CC and BCC if provided
-        if cc:
-            msg["Cc"] = ", ".join(cc)
-        if bcc:
-            msg["Bcc"] = ", ".join(bcc)
+        # Add CC if provided (BCC stays out of the headers)
+        if spec.cc:
+            msg["Cc"] = ", ".join(spec.cc)
 
         # Handle reply headers
-        if reply_to_message:
+        if spec.reply_to_message:
             logger.debug(
-                f"Setting up reply headers for "
-                f"{reply_to_message.message_id[:30]}..."
+                "Setting up reply headers for %.30s...",
+                spec.reply_to_message.message_id
             )
-            self._add_reply_headers(msg, reply_to_message)
-
-        # Attach text content
-        text_part = MIMEText(text, "plain", "utf-8")
-        msg.attach(text_part)
+            self._add_reply_headers(msg, spec.reply_to_message)
 
-        # Attach HTML content if provided
-        if html:
-            html_part = MIMEText(html, "html", "utf-8")
-            msg.attach(html_part)
-
-        # Send via SMTP
-        try:
-            self._send_via_smtp(msg, to, cc, bcc)
-            logger.info(f"Email sent successfully: {message_id}")
-        except Exception as e:
-            logger.error(f"Failed to send email: {e}", exc_info=True)
-            raise
-
-        return message_id
+        buffer = BytesIO()
+        BytesGenerator(buffer, mangle_from_=False).flatten(msg, linesep="\r\n")
+        return buffer.getvalue(), message_id
 
     def _generate_message_id(self) -> str:
         """
@@ -126,18 +570,12 @@ class EmailSender:
         Returns:
             Message-ID string in standard format
         """
-        # Extract domain from email address
-        domain = self.account.email.split("@")[1]
-
-        # Generate unique ID
-        unique_id = str(uuid.uuid4())
-
         # Format: <unique_id@domain>
-        return f"<{unique_id}@{domain}>"
+        return f"<{uuid.uuid4().hex}@{self._msgid_domain}>"
 
     def _add_reply_headers(
         self,
-        msg: MIMEMultipart,
+        msg: MIMEBase,
         reply_to_message: EmailMessage
     ) -> None:
         """
@@ -149,29 +587,30 @@ class EmailSender:
         """
         # Set In-Reply-To
         msg["In-Reply-To"] = reply_to_message.message_id
-        logger.debug(f"Set In-Reply-To: {reply_to_message.message_id[:30]}...")
-
-        # Build References header
-        references = []
+        logger.debug(
+            "Set In-Reply-To: %.30s...", reply_to_message.message_id
+        )
 
-        # Include existing references from parent
-        if reply_to_message.references:
-            references.extend(reply_to_message.references)
+        # Build References header, starting from the parent's references
+        refs = reply_to_message.references
+        references = list(refs) if refs else []
 
-        # Add parent's Message-ID
-        if reply_to_message.message_id not in references:
+        # Add parent's Message-ID. References lists ancestors oldest
+        # first, so the parent's own ID can only already be present at
+        # the end; checking the tail keeps this O(1) on long threads
+        if not references or references[-1] != reply_to_message.message_id:
             references.append(reply_to_message.message_id)
 
         # Set References header
         if references:
             msg["References"] = " ".join(references)
             logger.debug(
-                f"Set References with {len(references)} message(s)"
+                "Set References with %d message(s)", len(references)
             )
 
     def _send_via_smtp(
         self,
-        msg: MIMEMultipart,
+        raw: bytes,
         to: str,
         cc: Optional[list[str]],
         bcc: Optional[list[str]]
@@ -179,8 +618,14 @@ class EmailSender:
         """
         Send message via SMTP server.
 
+        A pooled connection is reused when available. If the server
+        closed it in the meantime, the send is retried once on a fresh
+        connection. Transient failures (see _is_transient()) are retried
+        up to SEND_MAX_ATTEMPTS times with exponential backoff; permanent
+        ones are raised right away.
+
         Args:
-            msg: Prepared MIME message
+            raw: Message from _build_message()
             to: Primary recipient
             cc: CC recipients
             bcc: BCC recipients
@@ -188,32 +633,123 @@ class EmailSender:
         Raises:
             smtplib.SMTPException: If connection or sending fails
         """
-        # Collect all recipients
+        all_recipients = self._collect_recipients(to, cc, bcc)
+
+        key = self._pool_key()
+        for attempt in range(SEND_MAX_ATTEMPTS):
+            try:
+                server = _smtp_pool.checkout(key, self._open_connection)
+                server, refused = self._deliver(server, raw, all_recipients)
+                break
+            except Exception as e:
+                # Any broken connection was discarded, the next attempt
+                # checks out or opens another one
+                if attempt == SEND_MAX_ATTEMPTS - 1 or not _is_transient(e):
+                    raise
+                delay = 2 ** attempt
+                logger.warning(
+                    f"Transient SMTP failure ({e}), retrying in {delay}s"
+                )
+                time.sleep(delay)
+        _smtp_pool.checkin(key, server)
+
+        if refused is not None:
+            raise refused
+
+        logger.debug(
+            "Email sent to %d recipient(s)", len(all_recipients)
+        )
+
+    @staticmethod
+    def _collect_recipients(
+        to: str,
+        cc: Optional[list[str]],
+        bcc: Optional[list[str]]
+    ) -> list[str]:
+        """Get the envelope recipients: to, then cc, then bcc."""
         all_recipients = [to]
         if cc:
             all_recipients.extend(cc)
         if bcc:
             all_recipients.extend(bcc)
+        return all_recipients
+
+    def _pool_key(self) -> tuple:
+        """Get the key of this account's connections in the pool."""
+        return (
+            self.account.smtp_server,
+            self.account.smtp_port,
+            self.account.smtp_ssl,
+            self.account.email
+        )
+
+    def _deliver(
+        self,
+        server: smtplib.SMTP,
+        raw: bytes,
+        recipients: list[str]
+    ) -> tuple[smtplib.SMTP, Optional[smtplib.SMTPRecipientsRefused]]:
+        """
+        Send a message on a checked-out connection.
 
+        If the server closed the connection in the meantime, the send is
+        retried once on a fresh connection. A refusal of all recipients
+        is returned rather than raised, since the session stays usable.
+
+        Args:
+            server: Connection checked out from the pool
+            raw: Message from _build_message()
+            recipients: Envelope recipients
+
+        Returns:
+            Tuple of (connection to check back in, refusal or None)
+
+        Raises:
+            smtplib.SMTPException: If sending fails; the connection has
+                                   been discarded
+        """
+        try:
+            try:
+                server.sendmail(self.account.email, recipients, raw)
+            except smtplib.SMTPServerDisconnected:
+                # The server dropped the pooled connection while idle
+                logger.debug("SMTP connection lost, reconnecting")
+                _smtp_pool.discard(server)
+                server = self._open_connection()
+                server.sendmail(self.account.email, recipients, raw)
+        except smtplib.SMTPRecipientsRefused as e:
+            # smtplib already reset the transaction
+            return server, e
+        except Exception:
+            # The session state is unknown, do not reuse it
+            _smtp_pool.discard(server)
+            raise
+
+        return server, None
+
+    def _open_connection(self) -> smtplib.SMTP:
+        """
+        Connect and log in to the account's SMTP server.
+
+        Returns:
+            Authenticated SMTP connection
+
+        Raises:
+            smtplib.SMTPException: If connection or login fails
+        """
         logger.debug(
-            f"Connecting to SMTP server: "
-            f"{self.account.smtp_server}:{self.account.smtp_port}"
+            "Connecting to SMTP server: %s:%s",
+            self.account.smtp_server, self.account.smtp_port
         )
 
-        # Create SSL context (less strict for compatibility)
-        context = ssl.create_default_context()
-        # Allow older protocols for QQ mail compatibility
-        context.check_hostname = False
-        context.verify_mode = ssl.CERT_NONE
-
-        # Connect and send
+        # Connect
         if self.account.smtp_ssl:
             # Use SMTP_SSL for port 465
             logger.debug("Using SMTP_SSL")
             server = smtplib.SMTP_SSL(
                 self.account.smtp_server,
                 self.account.smtp_port,
-                context=context
+                context=self._SSL_CTX
             )
         else:
             # Use SMTP with STARTTLS for port 587
@@ -222,7 +758,7 @@ class EmailSender:
                 self.account.smtp_server,
                 self.account.smtp_port
             )
-            server.starttls(context=context)
+            server.starttls(context=self._SSL_CTX)
 
         try:
             logger.debug("SMTP connection established")
@@ -230,12 +766,8 @@ class EmailSender:
             # Login
             server.login(self.account.email, self.account.password)
             logger.debug("SMTP authentication successful")
+        except Exception:
+            _smtp_pool.discard(server)
+            raise
 
-            # Send email
-            server.send_message(msg, to_addrs=all_recipients)
-            logger.debug(
-                f"Email sent to {len(all_recipients)} recipient(s)"
-            )
-        finally:
-            server.quit()
-            logger.debug("SMTP connection closed")
+        return server
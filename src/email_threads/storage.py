@@ -1,13 +1,28 @@
 """In-memory message storage module."""
 
 import logging
+import sys
+from collections import OrderedDict
+from itertools import chain
 from threading import Lock
-from typing import Optional
+from typing import Callable, Iterable, Iterator, Optional
 
 from .message import EmailMessage
 
 logger = logging.getLogger(__name__)
 
+# Number of independently locked partitions of the storage (power of 2)
+STORAGE_SHARDS = 16
+_SHARD_MASK = STORAGE_SHARDS - 1
+
+# Default bound on the number of stored messages
+DEFAULT_MAX_SIZE = 100_000
+
+# Lock-free reads rely on the GIL. Free-threaded builds (3.13t) give no
+# such guarantee for iterating an OrderedDict that a writer reorders,
+# so reads take the shard locks there
+_GIL_ENABLED = getattr(sys, "_is_gil_enabled", lambda: True)()
+
 
 class MessageStorage:
     """
@@ -19,20 +34,105 @@ class MessageStorage:
 
     The storage only keeps messages that are relevant to the monitored
     accounts (i.e., messages exchanged between monitored accounts).
+
+    Messages are spread over STORAGE_SHARDS dicts by hash of their
+    Message-ID, each with its own lock, so concurrent add() calls only
+    wait for each other when their IDs land in the same shard.
+
+    The storage holds about max_size messages: each shard keeps its
+    least recently added message first and evicts it when the shard
+    exceeds its share of max_size. Recency is approximate, so reads
+    stay lock-free: get() only marks a message as referenced, and a
+    referenced message about to be evicted gets a second chance by
+    moving to the recent end instead.
+
+    Only writers take the locks. Lookups rely on single operations on a shard (get, in, len,
+    copying its keys) running under the GIL, so a reader sees a shard
+    either before or after a concurrent add(), never in between. On
+    free-threaded builds without the GIL, reads take the shard locks
+    instead.
     """
 
-    def __init__(self):
-        """Initialize an empty message storage."""
-        self._messages: dict[str, EmailMessage] = {}
-        self._lock = Lock()
-        logger.debug("MessageStorage initialized")
+    def __init__(self, max_size: Optional[int] = DEFAULT_MAX_SIZE):
+        """
+        Initialize an empty message storage.
+
+        Args:
+            max_size: Approximate upper bound on stored messages, or
+                      None for no bound. Default: 100,000
+
+        Raises:
+            ValueError: If max_size is not positive
+        """
+        if max_size is not None and max_size <= 0:
+            raise ValueError("max_size must be positive")
+
+        # Per-shard bound, rounded up so the total is at least max_size
+        self._shard_capacity = (
+            None if max_size is None else -(-max_size // STORAGE_SHARDS)
+        )
+        self._shards: list[OrderedDict[str, EmailMessage]] = [
+            OrderedDict() for _ in range(STORAGE_SHARDS)
+        ]
+        self._locks = [Lock() for _ in range(STORAGE_SHARDS)]
+        # Message-IDs read by get() since add() last considered them
+        # for eviction; set.add() needs no lock
+        self._referenced: list[set[str]] = [
+            set() for _ in range(STORAGE_SHARDS)
+        ]
+        self._listeners: list[Callable[[EmailMessage, bool], None]] = []
+        self._eviction_listeners: list[Callable[[str], None]] = []
+        self._clear_listeners: list[Callable[[], None]] = []
+        logger.debug("MessageStorage initialized (max_size=%s)", max_size)
+
+    def add_listener(
+        self,
+        listener: Callable[[EmailMessage, bool], None]
+    ) -> None:
+        """
+        Register a callable notified after every add().
+
+        The listener is called outside the storage locks with the stored
+        message and a flag telling whether it replaced an existing
+        message with the same Message-ID.
+
+        Args:
+            listener: Callable taking (message, replaced)
+        """
+        self._listeners.append(listener)
+
+    def add_eviction_listener(self, listener: Callable[[str], None]) -> None:
+        """
+        Register a callable notified when a message is evicted.
+
+        The listener is called outside the storage locks with the
+        Message-ID of the message dropped to stay within max_size.
+
+        Args:
+            listener: Callable taking (message_id)
+        """
+        self._eviction_listeners.append(listener)
+
+    def add_clear_listener(self, listener: Callable[[], None]) -> None:
+        """
+        Register a callable notified after every clear().
+
+        The listener is called outside the storage locks, without
+        arguments.
+
+        Args:
+            listener: Callable taking no arguments
+        """
+        self._clear_listeners.append(listener)
 
     def add(self, message: EmailMessage) -> None:
         """
         Add a message to storage.
 
         If a message with the same Message-ID already exists,
-        it will be replaced with the new message.
+        it will be replaced with the new message. If the storage is
+        full, the least recently used message of the shard is evicted.
+        Registered listeners are notified once the message is stored.
 
         Args:
             message: EmailMessage instance to store
@@ -46,13 +146,34 @@ class MessageStorage:
         if not message.message_id:
             raise ValueError("Cannot add message with empty message_id")
 
-        with self._lock:
-            self._messages[message.message_id] = message
+        evicted_id = None
+        index = hash(message.message_id) & _SHARD_MASK
+        messages = self._shards[index]
+        with self._locks[index]:
+            replaced = message.message_id in messages
+            messages[message.message_id] = message
+            messages.move_to_end(message.message_id)
+            if (
+                self._shard_capacity is not None
+                and len(messages) > self._shard_capacity
+            ):
+                evicted_id = self._evict(messages, self._referenced[index])
+
+        if evicted_id is not None:
+            logger.debug("Message evicted from storage: %.30s...", evicted_id)
+            for listener in self._eviction_listeners:
+                listener(evicted_id)
+
+        # Logged after releasing the lock, which only guards the dict.
+        # count() walks every shard, only pay for it when logged
+        if logger.isEnabledFor(logging.DEBUG):
             logger.debug(
-                f"Message added to storage: {message.message_id[:30]}... "
-                f"(total: {len(self._messages)})"
+                "Message added to storage: %.30s... (total: %d)",
+                message.message_id, self.count()
             )
 
+        self._notify_listeners(message, replaced)
+
     def get(self, message_id: str) -> Optional[EmailMessage]:
         """
         Retrieve a message by its Message-ID.
@@ -67,20 +188,56 @@ class MessageStorage:
             logger.warning("Attempted to get message with empty message_id")
             return None
 
-        with self._lock:
-            message = self._messages.get(message_id)
-            if message:
-                logger.debug(f"Message found in storage: {message_id[:30]}...")
-            else:
-                logger.debug(
-                    f"Message not found in storage: {message_id[:30]}..."
-                )
-            return message
+        index = hash(message_id) & _SHARD_MASK
+        messages = self._shards[index]
+        if _GIL_ENABLED:
+            # Lock-free lookup, see the class docstring
+            message = messages.get(message_id)
+        else:
+            with self._locks[index]:
+                message = messages.get(message_id)
+        if message is None:
+            logger.debug("Message not found in storage: %.30s...", message_id)
+            return None
+
+        if self._shard_capacity is not None:
+            # Recently used, taken into account by the next eviction
+            self._referenced[index].add(message_id)
+
+        logger.debug("Message found in storage: %.30s...", message_id)
+        return message
 
     def exists(self, message_id: str) -> bool:
         """
         Check if a message exists in storage.
 
+        With the GIL, the check does not take any lock. It reflects
+        every add() that has returned, but may answer False for a message whose add() is
+        running concurrently. Polling callers simply see the message on
+        their next cycle; use exists_strict() when that is not enough.
+
+        Args:
+            message_id: The Message-ID to check
+
+        Returns:
+            True if message exists, False otherwise
+        """
+        if not message_id:
+            return False
+
+        if not _GIL_ENABLED:
+            return self.exists_strict(message_id)
+
+        # Lock-free, see the class docstring
+        return message_id in self._shards[hash(message_id) & _SHARD_MASK]
+
+    def exists_strict(self, message_id: str) -> bool:
+        """
+        Check if a message exists in storage, waiting for pending writes.
+
+        Unlike exists(), this takes the shard lock, so an add() of the
+        same Message-ID that is already running completes first.
+
         Args:
             message_id: The Message-ID to check
 
@@ -90,8 +247,34 @@ class MessageStorage:
         if not message_id:
             return False
 
-        with self._lock:
-            return message_id in self._messages
+        lock, messages = self._shard(message_id)
+        with lock:
+            return message_id in messages
+
+    def exists_many(self, message_ids: Iterable[str]) -> set[str]:
+        """
+        Check which of several Message-IDs exist in storage.
+
+        Like exists(), this does not take any lock with the GIL.
+
+        Args:
+            message_ids: The Message-IDs to check
+
+        Returns:
+            Set of the given Message-IDs that are already stored
+        """
+        if not _GIL_ENABLED:
+            return {
+                message_id for message_id in message_ids
+                if self.exists_strict(message_id)
+            }
+
+        shards = self._shards
+        return {
+            message_id for message_id in message_ids
+            if message_id
+            and message_id in shards[hash(message_id) & _SHARD_MASK]
+        }
 
     def get_all_message_ids(self) -> list[str]:
         """
@@ -100,8 +283,26 @@ class MessageStorage:
         Returns:
             List of all Message-IDs
         """
-        with self._lock:
-            return list(self._messages.keys())
+        return [
+            message_id
+            for index in range(STORAGE_SHARDS)
+            for message_id in self._snapshot(index)
+        ]
+
+    def iter_message_ids(self) -> Iterator[str]:
+        """
+        Iterate over the Message-IDs currently in storage.
+
+        Unlike get_all_message_ids(), no list of every ID is built:
+        each shard is copied only when the iteration reaches it, so
+        adds and clears running meanwhile never break the iteration.
+
+        Returns:
+            Iterator over Message-IDs
+        """
+        return chain.from_iterable(
+            self._snapshot(index) for index in range(STORAGE_SHARDS)
+        )
 
     def count(self) -> int:
         """
@@ -110,8 +311,15 @@ class MessageStorage:
         Returns:
             Number of stored messages
         """
-        with self._lock:
-            return len(self._messages)
+        if not _GIL_ENABLED:
+            count = 0
+            for lock, messages in zip(self._locks, self._shards):
+                with lock:
+                    count += len(messages)
+            return count
+
+        # Lock-free, see the class docstring
+        return sum(len(messages) for messages in self._shards)
 
     def clear(self) -> None:
         """
@@ -119,7 +327,88 @@ class MessageStorage:
 
         This is useful for testing or resetting the storage state.
         """
-        with self._lock:
-            count = len(self._messages)
-            self._messages.clear()
-            logger.info(f"Storage cleared ({count} messages removed)")
+        count = 0
+        for lock, messages, referenced in zip(
+            self._locks, self._shards, self._referenced
+        ):
+            with lock:
+                count += len(messages)
+                messages.clear()
+                referenced.clear()
+        logger.info(f"Storage cleared ({count} messages removed)")
+
+        for listener in self._clear_listeners:
+            listener()
+
+    def _notify_listeners(self, message: EmailMessage, replaced: bool) -> None:
+        """
+        Call every registered listener about a stored message.
+
+        Must be called without holding any storage lock.
+
+        Args:
+            message: The message just stored
+            replaced: Whether it replaced a message with the same ID
+        """
+        for listener in self._listeners:
+            listener(message, replaced)
+
+    @staticmethod
+    def _evict(
+        messages: OrderedDict[str, EmailMessage],
+        referenced: set[str]
+    ) -> str:
+        """
+        Drop the least recently used message of a full shard.
+
+        Messages at the old end that were read since they were last
+        considered move to the recent end instead, once. Must be called
+        with the shard lock held.
+
+        Args:
+            messages: The shard
+            referenced: Message-IDs of the shard read by get()
+
+        Returns:
+            Message-ID of the evicted message
+        """
+        for _ in range(len(messages)):
+            oldest_id = next(iter(messages))
+            if oldest_id not in referenced:
+                break
+            referenced.discard(oldest_id)
+            messages.move_to_end(oldest_id)
+
+        evicted_id, _ = messages.popitem(last=False)
+        referenced.discard(evicted_id)
+        return evicted_id
+
+    def _snapshot(self, index: int) -> tuple[str, ...]:
+        """
+        Copy the Message-IDs of one shard.
+
+        Lock-free where the GIL allows it, see the class docstring.
+
+        Args:
+            index: Shard index
+
+        Returns:
+            Tuple of the shard's Message-IDs
+        """
+        if _GIL_ENABLED:
+            return tuple(self._shards[index])
+        with self._locks[index]:
+            return tuple(self._shards[index])
+
+    def _shard(self, message_id: str) -> tuple[Lock, dict[str, EmailMessage]]:
+        """
+        Get the lock and dict of the shard holding a Message-ID.
+
+        Args:
+            message_id: The Message-ID to locate
+
+        Returns:
+            Tuple of (shard lock, shard dict)
+        """
+        index = hash(message_id) & _SHARD_MASK
+        return self._locks[index], self._shards[index]